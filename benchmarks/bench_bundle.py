@@ -0,0 +1,55 @@
+"""Report the size of the frontend bundle every component iframe loads.
+
+Prints the raw and gzipped size of each file in the frontend build and exits
+with an error when the gzipped index.html and JavaScript an iframe loads
+exceed BUDGET, so that it can run in CI after the frontend is built. Inline
+builds (``npm run build:inline``) are a single index.html. The webpack build
+itself also fails when an asset grows past its raw size budget (see
+webpack.config.js).
+
+Run with:
+    python benchmarks/bench_bundle.py
+"""
+
+import gzip
+import os
+import sys
+
+# Gzipped bytes of HTML and JavaScript an iframe may download
+BUDGET = 8 * 1024
+
+
+def sizes(build_dir):
+    """Return ``{name: (raw_bytes, gzipped_bytes)}`` for the files in build_dir."""
+    result = {}
+    for name in sorted(os.listdir(build_dir)):
+        path = os.path.join(build_dir, name)
+        if not os.path.isfile(path):
+            continue
+        with open(path, "rb") as f:
+            data = f.read()
+        result[name] = (len(data), len(gzip.compress(data, compresslevel=9)))
+    return result
+
+
+def main():
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    build_dir = os.path.join(
+        repo_root, "streamlit_adjustable_columns", "frontend", "build"
+    )
+    if not os.path.isdir(build_dir):
+        sys.exit(f"No frontend build in {build_dir}, run `npm run build` first")
+
+    total = 0
+    for name, (raw, gzipped) in sizes(build_dir).items():
+        print(f"{name:<24} {raw / 1024:8.1f} KiB {gzipped / 1024:8.1f} KiB gzip")
+        if name.endswith((".html", ".js")):
+            total += gzipped
+
+    print(f"{'Loaded per iframe':<24} {'':>12} {total / 1024:8.1f} KiB gzip")
+    if total > BUDGET:
+        sys.exit(f"Frontend bundle exceeds the {BUDGET / 1024:.0f} KiB gzip budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark the per-call cost of generating a layout key when key=None.
+
+Compares the original approach (inspect the caller frame and md5-hash
+``filename:lineno`` on every call) with the cached call-site ids used by
+adjustable_columns(). Each simulated script run renders 30 layouts from a
+loop, like a page that builds its layouts in a helper.
+
+Run with:
+    python benchmarks/bench_call_site_key.py
+"""
+
+import hashlib
+import inspect
+import os
+import sys
+import timeit
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import streamlit_adjustable_columns  # noqa: E402
+from streamlit_adjustable_columns import _call_site_id  # noqa: E402
+
+LAYOUTS_PER_RUN = 30
+RUNS = 10_000
+
+
+class _FakeScriptRunContext:
+    """Stand-in for Streamlit's ScriptRunContext, which resets cursors per run."""
+
+    def __init__(self):
+        self.cursors = {}
+        self.fragment_ids_this_run = None
+        self.current_fragment_id = None
+
+
+def legacy_key():
+    caller = inspect.currentframe().f_back
+    try:
+        src = f"{caller.f_code.co_filename}:{caller.f_lineno}"
+    finally:
+        del caller
+    return hashlib.md5(src.encode()).hexdigest()[:8]
+
+
+def cached_key():
+    return _call_site_id(sys._getframe(1))
+
+
+def main():
+    ctx = _FakeScriptRunContext()
+    streamlit_adjustable_columns.get_script_run_ctx = lambda: ctx
+
+    for name, func in [("legacy (inspect + md5)", legacy_key), ("cached", cached_key)]:
+
+        def script_run():
+            ctx.cursors = {}
+            for _ in range(LAYOUTS_PER_RUN):
+                func()
+
+        seconds = timeit.timeit(script_run, number=RUNS)
+        per_call = seconds / (RUNS * LAYOUTS_PER_RUN)
+        print(f"{name:<24} {per_call * 1e9:8.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Benchmark the time until a page's resize handles are shown.
+
+Serves an app with LAYOUTS sets of adjustable columns and loads it in a fresh
+Chromium context (cold cache) for every sample, with extra network latency
+emulated to stand in for a slow VPN link. Two times are reported:
+
+- per iframe: from the start of the iframe's navigation until its first
+  handle is in the DOM, i.e. index.html, the bundle and the first render;
+- per page: from the start of the page load until every strip has a handle.
+
+The frontend build in the package is measured, so run it once per build
+mode to compare them:
+
+    cd streamlit_adjustable_columns/frontend && npm run build
+    python benchmarks/bench_first_handle.py
+    cd streamlit_adjustable_columns/frontend && npm run build:inline
+    python benchmarks/bench_first_handle.py
+
+Requires the e2e test dependencies (Playwright with Chromium).
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+from playwright.sync_api import sync_playwright
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from tests.e2e_utils import StreamlitRunner  # noqa: E402
+
+SAMPLES = 10
+LAYOUTS = 8
+
+_APP = """
+from streamlit_adjustable_columns import adjustable_columns
+
+for index in range({layouts}):
+    for column in adjustable_columns(3, key=f"layout_{{index}}"):
+        column.write("Content")
+"""
+
+# Runs in every frame before its own scripts. Component iframes record when
+# their first handle is added, relative to their own navigation start.
+_INIT_SCRIPT = """
+if (window !== window.top) {
+    new MutationObserver((mutations, observer) => {
+        if (document.querySelector(".resize-handle")) {
+            window.__firstHandle = performance.now()
+            observer.disconnect()
+        }
+    }).observe(document, { childList: true, subtree: true })
+}
+"""
+
+IFRAME_SELECTOR = (
+    'iframe[title="streamlit_adjustable_columns.streamlit_adjustable_columns"]'
+)
+
+
+def build_mode():
+    """Return "inline" or "bundle" depending on the current frontend build."""
+    manifest = os.path.join(
+        REPO_ROOT,
+        "streamlit_adjustable_columns",
+        "frontend",
+        "build",
+        "asset-manifest.json",
+    )
+    with open(manifest, encoding="utf-8") as f:
+        files = json.load(f)["files"]
+    return "bundle" if "main.js" in files else "inline"
+
+
+def sample(browser, url, latency, layouts):
+    """Load the app once, returning the per-iframe and per-page times in ms."""
+    context = browser.new_context()
+    try:
+        page = context.new_page()
+        page.add_init_script(_INIT_SCRIPT)
+        cdp = context.new_cdp_session(page)
+        cdp.send("Network.enable")
+        cdp.send(
+            "Network.emulateNetworkConditions",
+            {
+                "offline": False,
+                "latency": latency,
+                "downloadThroughput": -1,
+                "uploadThroughput": -1,
+            },
+        )
+
+        page.goto(url)
+        page.wait_for_function(
+            f"document.querySelectorAll('{IFRAME_SELECTOR}').length === {layouts}"
+        )
+        page_origin = page.evaluate("performance.timeOrigin")
+
+        per_iframe = []
+        page_done = 0
+        for iframe in page.locator(IFRAME_SELECTOR).element_handles():
+            frame = iframe.content_frame()
+            frame.wait_for_function("window.__firstHandle !== undefined")
+            origin, first_handle = frame.evaluate(
+                "[performance.timeOrigin, window.__firstHandle]"
+            )
+            per_iframe.append(first_handle)
+            page_done = max(page_done, origin + first_handle - page_origin)
+        return statistics.median(per_iframe), page_done
+    finally:
+        context.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=100,
+        help="Latency added to every request, in ms (default: 100)",
+    )
+    parser.add_argument("--samples", type=int, default=SAMPLES)
+    parser.add_argument("--layouts", type=int, default=LAYOUTS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = Path(tmp) / "bench_app.py"
+        app.write_text(_APP.format(layouts=args.layouts))
+        with StreamlitRunner(app) as runner, sync_playwright() as playwright:
+            browser = playwright.chromium.launch()
+            # The first load starts the script runner, don't count it
+            sample(browser, runner.server_url, args.latency, args.layouts)
+            samples = [
+                sample(browser, runner.server_url, args.latency, args.layouts)
+                for _ in range(args.samples)
+            ]
+            browser.close()
+
+    print(
+        f"{build_mode()} build, {args.layouts} layouts, "
+        f"{args.latency:g} ms latency, median of {args.samples}"
+    )
+    for index, name in enumerate(["first handle (iframe)", "all handles (page)"]):
+        median = statistics.median(values[index] for values in samples)
+        print(f"{name:<22} {median:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark the cold-start cost of importing streamlit_adjustable_columns.
+
+Every sample runs in a fresh interpreter. Streamlit itself is imported first
+and timed separately, so the reported package time is what importing this
+package adds on top of it. The one-time cost deferred to the first
+adjustable_columns() call is measured with warmup().
+
+Run with:
+    python benchmarks/bench_import.py
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+SAMPLES = 15
+
+_SCRIPT = """
+import time
+start = time.perf_counter()
+import streamlit
+after_streamlit = time.perf_counter()
+import streamlit_adjustable_columns
+after_package = time.perf_counter()
+streamlit_adjustable_columns.warmup()
+after_warmup = time.perf_counter()
+print(after_streamlit - start)
+print(after_package - after_streamlit)
+print(after_warmup - after_package)
+"""
+
+
+def sample():
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=repo_root)
+    output = subprocess.run(
+        [sys.executable, "-c", _SCRIPT],
+        env=env,
+        cwd=repo_root,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return [float(value) for value in output.split()]
+
+
+def main():
+    # The first run writes the bytecode caches, don't count it
+    sample()
+    samples = [sample() for _ in range(SAMPLES)]
+
+    for index, name in enumerate(["import streamlit", "import package", "warmup()"]):
+        median = statistics.median(values[index] for values in samples)
+        print(f"{name:<18} {median * 1e3:8.1f} ms (median of {SAMPLES})")
+
+
+if __name__ == "__main__":
+    main()
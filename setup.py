@@ -1,4 +1,5 @@
 from setuptools import setup
+import json
 import os
 import subprocess
 import sys
@@ -11,9 +12,14 @@ def build_frontend():
     frontend_dir = os.path.join(this_directory, "streamlit_adjustable_columns", "frontend")
     build_dir = os.path.join(frontend_dir, "build")
 
-    # Skip build if compiled assets already exist
-    required = ["index.html", "main.js"]
-    if all(os.path.exists(os.path.join(build_dir, f)) for f in required):
+    # Skip build if compiled assets already exist. The bundle name contains
+    # a content hash, so the files are listed in the build's manifest.
+    try:
+        with open(os.path.join(build_dir, "asset-manifest.json")) as f:
+            required = list(json.load(f)["files"].values())
+    except (OSError, ValueError, KeyError):
+        required = None
+    if required and all(os.path.exists(os.path.join(build_dir, f)) for f in required):
         print("Frontend already built. Skipping build.")
         return True
 
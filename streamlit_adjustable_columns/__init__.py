@@ -1,11 +1,48 @@
 # flake8: noqa: E501 C901
 
+import functools
 import hashlib
 import inspect
+import json
 import os
+import sys
 
 import streamlit as st
-import streamlit.components.v1 as components
+
+from .persistence import (
+    FileBackend,
+    LayoutBackend,
+    LayoutStore,
+    MemoryBackend,
+    SQLiteBackend,
+)
+from .presets import LayoutPreset, PresetRegistry, load_presets
+from .state import (
+    LayoutState,
+    decode_hidden,
+    decode_widths,
+    encode_hidden,
+    encode_widths,
+    intern_labels,
+    unpack_hidden,
+)
+
+try:
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+except ImportError:  # Streamlit < 1.12
+
+    def get_script_run_ctx():
+        return None
+
+
+if "suppress_warning" in inspect.signature(get_script_run_ctx).parameters:
+    get_script_run_ctx = functools.partial(get_script_run_ctx, suppress_warning=True)
+
+try:
+    from streamlit.runtime.scriptrunner_utils.script_run_context import ThreadState
+except ImportError:  # Older Streamlit keeps the fragment id on the context
+    ThreadState = None
+
 
 __version__ = "0.2.1"
 
@@ -13,21 +50,51 @@ __version__ = "0.2.1"
 # the component, and True when we're ready to package and distribute it.
 _RELEASE = True
 
-if not _RELEASE:
-    _component_func = components.declare_component(
-        "streamlit_adjustable_columns",
-        url="http://localhost:3001",
-    )
-else:
+
+@functools.lru_cache(maxsize=None)
+def _declare_component():
+    """Check the frontend assets and declare the component, once per process.
+
+    Deferred until first use: importing streamlit.components.v1 and declaring
+    the component account for most of the time it takes to import this
+    package. See warmup() to do it ahead of time.
+    """
+    import streamlit.components.v1 as components
+
+    if not _RELEASE:
+        return components.declare_component(
+            "streamlit_adjustable_columns",
+            url="http://localhost:3001",
+        )
+
     parent_dir = os.path.dirname(os.path.abspath(__file__))
     build_dir = os.path.join(parent_dir, "frontend/build")
+    _check_build(build_dir)
+
+    return components.declare_component("streamlit_adjustable_columns", path=build_dir)
 
-    # Check if build directory and required files exist
-    index_html = os.path.join(build_dir, "index.html")
-    main_js = os.path.join(build_dir, "main.js")
 
-    # Check if build directory exists
-    if not os.path.exists(index_html) or not os.path.exists(main_js):
+def _check_build(build_dir):
+    """Check that the frontend build has every file listed in its manifest.
+
+    The bundle's file name contains a hash of its content, so the files are
+    looked up in the ``asset-manifest.json`` written by the build rather
+    than by fixed names. Inline builds (``npm run build:inline``) only have
+    an index.html.
+    """
+    try:
+        with open(
+            os.path.join(build_dir, "asset-manifest.json"), encoding="utf-8"
+        ) as f:
+            files = json.load(f)["files"]
+    except (OSError, ValueError, KeyError):
+        files = None
+
+    if (
+        not files
+        or "index.html" not in files
+        or not all(os.path.isfile(os.path.join(build_dir, f)) for f in files.values())
+    ):
         raise RuntimeError(
             f"Compiled frontend assets not found in: {build_dir}\n"
             "This usually means the frontend wasn't built during installation.\n"
@@ -36,20 +103,489 @@ else:
             "Alternatively install from PyPI where prebuilt assets are included."
         )
 
-    _component_func = components.declare_component(
-        "streamlit_adjustable_columns", path=build_dir
-    )
+
+def _component_func(*args, **kwargs):
+    """Render the resize handles component, declaring it on first use."""
+    return _declare_component()(*args, **kwargs)
+
+
+def warmup():
+    """Check the frontend assets and declare the component now.
+
+    This otherwise happens on the first adjustable_columns() call. Calling it
+    at server start (e.g. at the top of the main script, or where worker
+    processes are initialized) moves that one-time cost out of the first
+    user's request and fails early if the frontend build is missing.
+    """
+    _declare_component()
+    _component_supports_on_change()
+
+
+# Older Streamlit releases don't accept an on_change callback for custom
+# components. In that case we fall back to committing the new widths inside
+# the script run and calling st.rerun(). None until first checked.
+_COMPONENT_SUPPORTS_ON_CHANGE = None
+
+
+def _component_supports_on_change():
+    """Whether the installed Streamlit accepts on_change for custom components."""
+    global _COMPONENT_SUPPORTS_ON_CHANGE
+    if _COMPONENT_SUPPORTS_ON_CHANGE is None:
+        _COMPONENT_SUPPORTS_ON_CHANGE = (
+            "on_change"
+            in inspect.signature(type(_declare_component()).__call__).parameters
+        )
+    return _COMPONENT_SUPPORTS_ON_CHANGE
+
+
+def _fingerprint(config):
+    """Return a short digest of a component config.
+
+    It is sent along with the config so that the frontend can skip
+    rebuilding its strips on reruns that didn't change anything.
+    """
+    data = json.dumps(config, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(data.encode(), digest_size=8).hexdigest()
+
+
+# Optional persistent store for layouts, see set_layout_store()
+_layout_store = None
+_layout_profile = None
+
+
+def set_layout_store(store, *, profile=None):
+    """Persist layouts across sessions in ``store``.
+
+    Once set, layouts without state in the current session start from the
+    last widths and hidden flags stored for the profile, and every change is
+    written back to the store in the background.
+
+    Parameters
+    ----------
+    store : LayoutStore or None
+        The store to use, or None to stop persisting layouts.
+    profile : str or callable, optional
+        The user or profile id layouts are stored under, or a callable
+        returning it (called on every read and write, e.g.
+        ``lambda: st.user.email``). Defaults to a single shared profile.
+    """
+    global _layout_store, _layout_profile
+    _layout_store = store
+    _layout_profile = profile
+
+
+def _current_profile():
+    profile = _layout_profile() if callable(_layout_profile) else _layout_profile
+    return "default" if profile is None else str(profile)
+
+
+def _load_persisted(layout_id):
+    """Return the stored state of a layout, or None without a store."""
+    if _layout_store is None or layout_id is None:
+        return None
+    return _layout_store.get(_current_profile(), layout_id)
+
+
+def _persist(layout_id, state):
+    """Queue a layout's state for writing to the store, if there is one."""
+    if _layout_store is not None and layout_id is not None:
+        _layout_store.put(_current_profile(), layout_id, state)
+
+
+# Optional registry of named layout presets, see set_presets()
+_presets = None
+
+# Session state key of the preset chosen from a handle strip
+_ACTIVE_PRESET_KEY = "adjustable_columns_active_preset"
+
+
+def set_presets(presets):
+    """Set the named layout presets available to ``adjustable_columns(preset=...)``.
+
+    Parameters
+    ----------
+    presets : PresetRegistry, str, os.PathLike or None
+        A registry, or the path of a JSON or TOML preset file (parsed once
+        per process, see load_presets()). None removes the presets.
+    """
+    global _presets
+    if presets is not None and not isinstance(presets, PresetRegistry):
+        presets = load_presets(presets)
+    _presets = presets
+
+
+def _apply_preset(preset, unique_id, state):
+    """Apply the active preset to a layout's state if it changed.
+
+    The preset chosen from a handle strip takes precedence over ``preset``.
+    Bumps the layout's version so that component values sent before the
+    preset was applied are ignored.
+    """
+    if _presets is None:
+        raise ValueError("preset requires presets to be set with set_presets()")
+
+    name = st.session_state.get(_ACTIVE_PRESET_KEY, preset)
+    if name not in _presets:
+        raise ValueError(f"Unknown preset: {name}")
+
+    if state.preset == name:
+        return name
+    state.preset = name
+
+    layout = _presets.get(name, unique_id)
+    if layout is None or len(layout.widths) != state.count:
+        return name
+
+    state.update(layout.widths, layout.hidden)
+    state.version += 1
+    _persist(unique_id, state.to_dict())
+    return name
+
+
+# Layouts not rendered for more than this many script runs lose their
+# session state, see set_state_retention(). None (the default) keeps all state.
+_max_idle_runs = None
+_retention_per_page = False
+
+# Session state key of the bookkeeping used to evict idle layout state
+_RETENTION_KEY = "adjustable_columns_retention"
+
+
+def set_state_retention(max_idle_runs, *, per_page=False):
+    """Configure when the session state of unused layouts is evicted.
+
+    Every layout keeps its widths and hidden flags in ``st.session_state``.
+    Layouts that go away (a page, a loop iteration or a conditional branch)
+    leave that state behind for the rest of the session. By default it is
+    kept; apps with many short-lived layouts can opt in to evicting it.
+
+    Parameters
+    ----------
+    max_idle_runs : int or None
+        State of layouts that have not been rendered in this many script
+        runs (counting runs that render at least one adjustable layout) is
+        removed. Evicted layouts start over from their spec, or from the
+        layout store if one is set. None keeps all state, which is the
+        default.
+    per_page : bool, default False
+        Count idle runs per page in multipage apps, so that layouts are only
+        evicted by runs of their own page.
+    """
+    global _max_idle_runs, _retention_per_page
+    if max_idle_runs is not None and (
+        not isinstance(max_idle_runs, int) or max_idle_runs < 1
+    ):
+        raise ValueError("max_idle_runs must be a positive integer or None")
+    _max_idle_runs = max_idle_runs
+    _retention_per_page = per_page
+
+
+def _track_state(owner_id, keys):
+    """Mark the session state ``keys`` of a layout as used in this run.
+
+    The first call of every run also evicts the state of layouts that have
+    not been rendered for more than ``_max_idle_runs`` runs. Fragment reruns
+    only render part of the page, so they don't count as runs.
+    """
+    if _max_idle_runs is None:
+        return
+
+    ctx = get_script_run_ctx()
+    page = None
+    if _retention_per_page:
+        page = getattr(ctx, "page_script_hash", None)
+
+    retention = st.session_state.get(_RETENTION_KEY)
+    if retention is None:
+        retention = {"runs": {}, "seen": {}}
+        st.session_state[_RETENTION_KEY] = retention
+
+    registry = _run_registry()
+    if not registry.get("state_retention") and not getattr(
+        ctx, "fragment_ids_this_run", None
+    ):
+        registry["state_retention"] = True
+        run = retention["runs"][page] = retention["runs"].get(page, 0) + 1
+        for idle_id, (seen_page, seen_run, idle_keys) in list(
+            retention["seen"].items()
+        ):
+            if seen_page == page and run - seen_run > _max_idle_runs:
+                del retention["seen"][idle_id]
+                for idle_key in idle_keys:
+                    st.session_state.pop(idle_key, None)
+
+    retention["seen"][owner_id] = (page, retention["runs"].get(page, 0), keys)
+
+
+def _is_current(value, state):
+    """Whether a component value was sent for the current layout version."""
+    if not isinstance(value, dict):
+        return True
+    return value.get("version", state.version) == state.version
+
+
+def _state_key(unique_id):
+    """Return the session state key holding a layout's LayoutState."""
+    return f"adjustable_columns_state_{unique_id}"
+
+
+def _store_component_value(value, state, layout_id=None):
+    """Write a component value into a layout's state, returning whether it changed.
+
+    Changes are also written to the layout store under ``layout_id``.
+    """
+    if not isinstance(value, dict):
+        return False
+    widths = value.get("widths")
+    hidden = value.get("hidden")
+    # Virtual strips send the compact encoding
+    if isinstance(widths, str):
+        widths = decode_widths(widths)
+    if isinstance(hidden, str):
+        hidden = unpack_hidden(decode_hidden(hidden), state.count)
+    if widths is not None and len(widths) != state.count:
+        return False
+    changed = state.update(widths, hidden)
+    if changed:
+        _persist(layout_id, state.to_dict())
+    return changed
+
+
+def _store_geometry(value, state):
+    """Write the pixel geometry reported by the frontend into a layout's state."""
+    if isinstance(value, dict) and "pixelWidths" in value:
+        state.container_width = value.get("containerWidth")
+        pixel_widths = value["pixelWidths"]
+        if isinstance(pixel_widths, str):
+            pixel_widths = decode_widths(pixel_widths)
+        state.pixel_widths = tuple(pixel_widths)
+        state.device_pixel_ratio = value.get("devicePixelRatio", 1)
+
+
+def _commit_component_value(
+    component_key, state_key, on_change=None, *, layout_id=None
+):
+    """Copy the latest component value into session state before the script runs.
+
+    Streamlit invokes this as the component's on_change callback, so the run
+    triggered by a drag or double-click already builds st.columns with the
+    new widths and no second run is needed.
+    """
+    value = st.session_state.get(component_key)
+    state = st.session_state.get(state_key)
+    if value and state is not None and _is_current(value, state):
+        if value.get("action") == "preset":
+            # Applied to every layout using presets when the script runs
+            st.session_state[_ACTIVE_PRESET_KEY] = value["preset"]
+        else:
+            _store_component_value(value, state, layout_id)
+        _store_geometry(value, state)
+        if value.get("action") == "measure":
+            # The frontend only reported new pixel sizes, not a user change
+            return
+
+    if on_change is not None:
+        on_change()
+
+
+def _commit_batch_value(component_key, state_keys, on_change=None):
+    """on_change callback of an adjustable_layouts() component.
+
+    ``state_keys`` holds the ``(state_key, layout_id)`` of each layout, in the
+    same order as the ``layouts`` list of the component value.
+    """
+    value = st.session_state.get(component_key)
+    if value:
+        for layout_value, (state_key, layout_id) in zip(
+            value.get("layouts", []), state_keys
+        ):
+            state = st.session_state.get(state_key)
+            if state is not None:
+                _store_component_value(layout_value, state, layout_id)
+
+    if on_change is not None:
+        on_change()
+
+
+def _grid_state_from_value(value, state):
+    """Return the grid state with a component value applied.
+
+    Values whose widths, heights or hidden flags don't match the number of
+    columns and rows of ``state`` (e.g. sent before the grid's spec changed)
+    are ignored and ``state`` is returned unchanged.
+    """
+    new_state = {
+        name: value.get(name, state[name]) for name in ("widths", "heights", "hidden")
+    }
+    if any(len(new_state[name]) != len(state[name]) for name in new_state):
+        return state
+    return new_state
+
+
+def _commit_grid_value(component_key, state_key, on_change=None):
+    """on_change callback of an adjustable_grid() component."""
+    value = st.session_state.get(component_key)
+    state = st.session_state.get(state_key)
+    if value and state is not None:
+        new_state = _grid_state_from_value(value, state)
+        if new_state != state:
+            st.session_state[state_key] = new_state
+            _persist(state_key, new_state)
+
+    if on_change is not None:
+        on_change()
+
+
+# Auto-generated layout ids, cached per call site as
+# ``id(code) -> (code, {lineno: id})``. Hashing a code object is expensive, so
+# the dict is keyed on its id and keeps the code alive to prevent id reuse.
+_CALL_SITE_IDS = {}
+
+
+def _run_registry(ctx=None):
+    """Return a dict that lives for the duration of the current script run.
+
+    Streamlit hands every run a fresh ``ctx.cursors`` dict, which we use as the
+    marker for "a new run has started". Fragment reruns get one too; their
+    registry refers to the one of the last full run under ``"full_run"``.
+    Outside of a script run (bare mode, tests) a throwaway dict is returned.
+    ``ctx`` saves looking up the script run context when the caller has it.
+    """
+    if ctx is None:
+        ctx = get_script_run_ctx()
+    if ctx is None:
+        return {}
+
+    cursors = getattr(ctx, "cursors", None)
+    marker = getattr(ctx, "_adjustable_columns_run", None)
+    if marker is None or marker[0] is not cursors:
+        registry = {}
+        if marker is not None and getattr(ctx, "fragment_ids_this_run", None):
+            registry["full_run"] = marker[1].get("full_run", marker[1])
+        marker = (cursors, registry)
+        ctx._adjustable_columns_run = marker
+    return marker[1]
+
+
+def _current_fragment_id(ctx):
+    """Return the id of the fragment being run, or None outside of fragments."""
+    try:
+        return ctx.current_fragment_id
+    except AttributeError:
+        pass
+    if ctx is None or ThreadState is None:
+        return None
+    try:
+        return ThreadState.get().fragment_id
+    except RuntimeError:  # Not in a script run
+        return None
+
+
+def _call_site_id(frame):
+    """Return a stable id for the adjustable_columns() call made from ``frame``.
+
+    The md5 of ``filename:lineno`` is computed once per call site and cached.
+    Repeated calls from the same site within one script run (e.g. in a loop)
+    get a ``_<n>`` suffix so that they don't share state. Fragment reruns
+    only run some of these calls, so the ids assigned inside a fragment are
+    recorded in full runs and reused, in order, by its reruns.
+    """
+    code = frame.f_code
+    lineno = frame.f_lineno
+
+    entry = _CALL_SITE_IDS.get(id(code))
+    if entry is None or entry[0] is not code:
+        entry = _CALL_SITE_IDS[id(code)] = (code, {})
+    site_ids = entry[1]
+
+    site_id = site_ids.get(lineno)
+    if site_id is None:
+        src = f"{code.co_filename}:{lineno}"
+        site_id = site_ids[lineno] = hashlib.md5(src.encode()).hexdigest()[:8]
+
+    ctx = get_script_run_ctx()
+    registry = _run_registry(ctx)
+    fragment_id = _current_fragment_id(ctx)
+    if fragment_id is not None and "full_run" in registry:
+        counts = registry.setdefault("fragment_call_sites", {})
+        count = counts.get((fragment_id, site_id), 0)
+        counts[(fragment_id, site_id)] = count + 1
+        full_run_ids = registry["full_run"].get("fragment_ids", {})
+        ids = full_run_ids.get((fragment_id, site_id), ())
+        if count < len(ids):
+            return ids[count]
+        # A call the last full run didn't make, e.g. behind a condition
+        return f"{site_id}_{fragment_id[:8]}_{count}"
+
+    # The cache is shared by all sessions, so the per-run suffix is built
+    # here rather than stored in it
+    counts = registry.setdefault("call_sites", {})
+    count = counts.get(site_id, 0)
+    counts[site_id] = count + 1
+    unique_id = site_id if count == 0 else f"{site_id}_{count}"
+    if fragment_id is not None:
+        fragment_ids = registry.setdefault("fragment_ids", {})
+        fragment_ids.setdefault((fragment_id, site_id), []).append(unique_id)
+    return unique_id
+
+
+_ALIGNMENT_CSS = """
+<style>
+/* Ensure the resize handles iframe has no extra spacing */
+iframe[title="streamlit_adjustable_columns.streamlit_adjustable_columns"] {
+    border: none !important;
+    background: transparent !important;
+    margin: 0 !important;
+    padding: 0 !important;
+}
+
+/* Remove any extra margins from the element container holding the iframe */
+.element-container:has(iframe[title="streamlit_adjustable_columns.streamlit_adjustable_columns"]) {
+    margin-bottom: 0 !important;
+}
+
+/* Ensure the following columns have proper spacing */
+.element-container:has(iframe[title="streamlit_adjustable_columns.streamlit_adjustable_columns"]) + div[data-testid="column"] {
+    margin-top: 0 !important;
+}
+
+.element-container:has(iframe[title="streamlit_adjustable_columns.streamlit_adjustable_columns"]) + div[data-testid="column"] ~ div[data-testid="column"] {
+    margin-top: 0 !important;
+}
+</style>
+"""
+
+
+def _inject_alignment_css():
+    """Emit the alignment CSS unless it was already emitted during this run."""
+    registry = _run_registry()
+    if registry.get("alignment_css"):
+        return
+    st.markdown(_ALIGNMENT_CSS, unsafe_allow_html=True)
+    registry["alignment_css"] = True
 
 
 class HidableContainer:
-    """A container that can be hidden/shown and acts like the wrapped container when visible."""
+    """A container that can be hidden/shown and acts like the wrapped container when visible.
+
+    The placeholder that swallows the output of ``with`` blocks is only
+    created when a hidden container is entered, and method wrappers are
+    created once per attribute and cached on the instance.
+    """
 
     def __init__(
         self, container: st.delta_generator.DeltaGenerator, is_hidden: bool = False
     ):
         self.container = container
         self.is_hidden = is_hidden
-        self.empty_container = container.empty()
+        self._empty_container = None
+
+    @property
+    def empty_container(self):
+        """Placeholder receiving the output of ``with`` blocks while hidden."""
+        if self._empty_container is None:
+            self._empty_container = self.container.empty()
+        return self._empty_container
 
     def __enter__(self):
         if self.is_hidden:
@@ -73,20 +609,215 @@ class HidableContainer:
             # If it's a callable method, wrap it to handle hidden state
             def wrapped_method(*args, **kwargs):
                 if self.is_hidden:
-                    # When hidden, call the method on the original container
-                    # This ensures the method exists and works as expected
-                    # attr(*args, **kwargs)
-                    return self.empty_container.empty()  # Clear it immediately
+                    # When hidden, skip the call entirely. Return the hidden
+                    # container itself so that ``with col.expander(...)``
+                    # still works, sending its output to the placeholder.
+                    return self
                 else:
                     # When visible, call the method normally
                     return attr(*args, **kwargs)
 
+            # Cache the wrapper on the instance so that later lookups don't
+            # go through __getattr__ again
+            self.__dict__[name] = wrapped_method
             return wrapped_method
         else:
             # For non-callable attributes, return them directly
             return attr
 
 
+def render_columns(columns, renderers):
+    """Render each column's content with a callable, skipping hidden columns.
+
+    Code inside ``with col:`` always runs, even when the column is hidden and
+    its output is discarded. Passing the content as callables instead means
+    the work for hidden columns (queries, chart building, ...) is never done.
+
+    Parameters
+    ----------
+    columns : list of HidableContainer or dict
+        The columns returned by adjustable_columns(), LayoutSlot.columns() or
+        a row of adjustable_grid(). The dict returned with
+        ``return_widths=True`` is accepted as well.
+    renderers : list of callable
+        One callable per column, called without arguments inside its column.
+        ``None`` entries are skipped.
+
+    Returns
+    -------
+    list
+        The return value of each renderer, or None for hidden or skipped
+        columns.
+
+    Examples
+    --------
+    >>> cols = adjustable_columns(3, labels=["Sales", "Costs", "Forecast"])
+    >>> render_columns(cols, [show_sales, show_costs, show_forecast])
+    """
+    if isinstance(columns, dict):
+        columns = columns["columns"]
+    if len(renderers) != len(columns):
+        raise ValueError("renderers must have the same length as the number of columns")
+
+    results = []
+    for column, renderer in zip(columns, renderers):
+        if renderer is None or getattr(column, "is_hidden", False):
+            results.append(None)
+            continue
+        with column:
+            results.append(renderer())
+    return results
+
+
+# Height of one strip of resize handles, in pixels
+_STRIP_HEIGHT = 60
+
+# Minimum width of a column, as a fraction of the total width
+MIN_WIDTH_RATIO = 0.06
+
+# Layouts with at least this many columns get a virtualized, horizontally
+# scrolling handle strip
+_VIRTUAL_MIN_COLUMNS = 50
+
+
+def _min_width_ratio(count):
+    """Return the minimum column width, as a fraction of the total width.
+
+    Virtualized layouts have too many columns for MIN_WIDTH_RATIO each, so
+    their minimum is at most half the average width, like in the frontend.
+    """
+    if count >= _VIRTUAL_MIN_COLUMNS:
+        return min(MIN_WIDTH_RATIO, 0.5 / count)
+    return MIN_WIDTH_RATIO
+
+
+def _parse_spec(spec):
+    """Turn an st.columns-style ``spec`` into a list of width ratios."""
+    # Handle spec parameter (same logic as st.columns)
+    if spec is None:
+        spec = 2  # Default to 2 equal columns
+
+    if isinstance(spec, int):
+        # Equal width columns
+        widths = [1] * spec
+    elif hasattr(spec, "__iter__"):
+        # Custom width ratios
+        widths = list(spec)
+    else:
+        raise ValueError("spec must be an integer or an iterable of numbers")
+
+    # Validate widths
+    if not widths:
+        raise ValueError("spec must specify at least one column")
+
+    if any(w <= 0 for w in widths):
+        raise ValueError("Column widths must be positive numbers")
+
+    return widths
+
+
+def _resolve_labels(labels, count):
+    """Return the handle labels, defaulting to "Col 1", "Col 2", etc."""
+    if labels is None:
+        return [f"Col {i+1}" for i in range(count)]
+    if len(labels) != count:
+        raise ValueError("labels must have the same length as the number of columns")
+    return labels
+
+
+def _resolve_initial_hidden(initial_hidden, count):
+    """Validate ``initial_hidden``, defaulting to all columns visible."""
+    if initial_hidden is None:
+        return [False] * count
+    if len(initial_hidden) != count:
+        raise ValueError(
+            "initial_hidden must have the same length as the number of columns"
+        )
+    if not all(isinstance(x, bool) for x in initial_hidden):
+        raise ValueError("initial_hidden must contain only boolean values")
+    return initial_hidden
+
+
+def _load_layout_state(
+    state_key, widths, initial_hidden, labels, layout_id=None, preset=None
+):
+    """Initialize or get a layout's LayoutState.
+
+    New sessions start from the layout store when one is set and it holds a
+    layout with the same number of columns. The stored layout takes
+    precedence over the layout's ``preset``, which is only recorded as
+    applied so that it doesn't overwrite the stored widths.
+    """
+    state = st.session_state.get(state_key)
+    if state is None:
+        stored = _load_persisted(layout_id)
+        if stored and len(stored["widths"]) == len(widths):
+            hidden = stored.get("hidden") or []
+            if len(hidden) != len(widths):
+                hidden = initial_hidden
+            state = LayoutState(stored["widths"], hidden, labels)
+            state.preset = preset
+            st.session_state[state_key] = state
+
+    # Start over from the spec for new layouts, or when the spec changed
+    if state is None or state.count != len(widths):
+        state = LayoutState(widths, initial_hidden, labels)
+        st.session_state[state_key] = state
+    else:
+        state.labels = intern_labels(labels)
+
+    return state
+
+
+# Keyword arguments of st.columns in the installed Streamlit version. Older
+# versions lack vertical_alignment (added in 1.36) and border (added in 1.43).
+_COLUMNS_PARAMS = frozenset(inspect.signature(st.columns).parameters)
+
+
+def _columns_kwargs(gap, vertical_alignment, border=None):
+    """Return the st.columns keyword arguments the installed Streamlit accepts."""
+    kwargs = {"gap": gap}
+    if "vertical_alignment" in _COLUMNS_PARAMS:
+        kwargs["vertical_alignment"] = vertical_alignment
+    if border is not None and "border" in _COLUMNS_PARAMS:
+        kwargs["border"] = border
+    return kwargs
+
+
+def _create_columns(current_widths, hidden_columns, *, columns_kwargs, return_widths):
+    """Create the st.columns for a layout and wrap them in HidableContainers."""
+    # Create the actual Streamlit columns with current widths
+    # Ensure each column is at least 6% of total width (less for very wide
+    # layouts, see _min_width_ratio)
+    total_width = sum(current_widths)
+    min_width_absolute = _min_width_ratio(len(current_widths)) * total_width
+
+    streamlit_widths = [max(width, min_width_absolute) for width in current_widths]
+
+    # Create the actual st.columns with all supported parameters
+    st_columns = st.columns(spec=streamlit_widths, **columns_kwargs)
+
+    # Wrap columns with HidableContainer based on hidden state. When nothing
+    # is hidden the st.columns containers are returned as they are.
+    if any(hidden_columns):
+        wrapped_columns = [
+            HidableContainer(col, is_hidden=hidden)
+            for col, hidden in zip(st_columns, hidden_columns)
+        ]
+    else:
+        wrapped_columns = list(st_columns)
+
+    # Return based on return_widths parameter
+    if return_widths:
+        return {
+            "columns": wrapped_columns,
+            "widths": current_widths,
+            "hidden": hidden_columns,
+        }
+    else:
+        return wrapped_columns
+
+
 def adjustable_columns(
     spec=None,
     *,
@@ -95,8 +826,13 @@ def adjustable_columns(
     border=False,
     labels=None,
     return_widths=False,
+    report_pixels=False,
     initial_hidden=None,
     key=None,
+    on_change=None,
+    live=False,
+    live_interval=0.25,
+    preset=None,
 ):
     """Create columns with adjustable widths using resizable boundaries.
 
@@ -122,23 +858,52 @@ def adjustable_columns(
         Custom labels for each column shown in the resize handles.
         If None, defaults to "Col 1", "Col 2", etc.
     return_widths : bool, default False
-        If True, returns a dict with 'columns' and 'widths' keys.
+        If True, returns a dict with 'columns', 'widths', 'hidden' and pixel
+        size keys.
         If False, returns just the list of column containers (like st.columns).
+    report_pixels : bool, default False
+        If True, the frontend reports the rendered pixel widths of the columns
+        whenever the page width changes, returned with ``return_widths=True``.
+        Every report triggers a rerun, so only enable it when the pixel sizes
+        are used.
     initial_hidden : list of bool, optional
         List of boolean values indicating which columns should start hidden.
         Must have the same length as the number of columns.
         If None, all columns start visible.
     key : str, optional
         An optional key that uniquely identifies this component.
+    on_change : callable, optional
+        An optional callback invoked when the user resizes, hides or shows a
+        column. It runs before the script reruns, after the new widths and
+        hidden state have been written to session state.
+    live : bool, default False
+        If True, widths are streamed to Python while the user drags a handle,
+        so the column content reflows during the drag. Updates are throttled
+        to ``live_interval`` and dropped while a rerun is still in flight; the
+        final position is always sent when the drag ends.
+    live_interval : float, default 0.25
+        Minimum time in seconds between two live updates.
+    preset : str, optional
+        Name of a layout preset (see set_presets()) to apply to this layout,
+        looked up by its key. The handle strip then also offers a preset
+        menu; choosing a preset there applies it to every layout using
+        presets in the session, in one script run.
 
     Returns
     -------
     list of containers or dict
         If return_widths=False: A list of column container objects, just like st.columns.
+        When any column is hidden, every column is wrapped in a HidableContainer
+        whose output is discarded while hidden.
         If return_widths=True: A dict with keys:
             - 'columns': List of column container objects
             - 'widths': Current width ratios of the columns
             - 'hidden': List of boolean values indicating which columns are hidden
+            - 'pixel_widths': Rendered width of each column in CSS pixels
+            - 'container_width': Rendered width of the whole set of columns
+            - 'device_pixel_ratio': The browser's window.devicePixelRatio
+            The pixel values are None until the frontend has reported them,
+            and stay None without ``report_pixels=True``.
 
     Examples
     --------
@@ -168,175 +933,584 @@ def adjustable_columns(
     >>> hidden = result['hidden']
     """
 
-    # Handle spec parameter (same logic as st.columns)
-    if spec is None:
-        spec = 2  # Default to 2 equal columns
+    layout = ColumnLayout(
+        spec,
+        gap=gap,
+        vertical_alignment=vertical_alignment,
+        border=border,
+        labels=labels,
+        return_widths=return_widths,
+        report_pixels=report_pixels,
+        initial_hidden=initial_hidden,
+        key=key,
+        on_change=on_change,
+        live=live,
+        live_interval=live_interval,
+        preset=preset,
+    )
 
-    if isinstance(spec, int):
-        # Equal width columns
-        widths = [1] * spec
-    elif hasattr(spec, "__iter__"):
-        # Custom width ratios
-        widths = list(spec)
+    # Create unique identifier for this set of columns
+    if key is None:
+        unique_id = _call_site_id(sys._getframe(1))
     else:
-        raise ValueError("spec must be an integer or an iterable of numbers")
+        unique_id = key
 
-    # Validate widths
-    if not widths:
-        raise ValueError("spec must specify at least one column")
+    return layout._render(unique_id)
 
-    if any(w <= 0 for w in widths):
-        raise ValueError("Column widths must be positive numbers")
 
-    # Set default labels
-    if labels is None:
-        labels = [f"Col {i+1}" for i in range(len(widths))]
-    elif len(labels) != len(widths):
-        raise ValueError("labels must have the same length as the number of columns")
+class ColumnLayout:
+    """A precompiled set of adjustable columns.
+
+    Validates its arguments and builds the static part of the component
+    config once, so that :meth:`render` only does the work that depends on
+    the session. Instances hold no session state and are not modified after
+    construction, so a single instance can be shared by all sessions, e.g. by
+    creating it in an ``st.cache_resource`` function.
+
+    Takes the same parameters as adjustable_columns().
+
+    Examples
+    --------
+    >>> @st.cache_resource
+    ... def dashboard_layout():
+    ...     return ColumnLayout([3, 1], labels=["Chart", "Filters"], key="dashboard")
+    >>> chart_col, filter_col = dashboard_layout().render()
+    """
+
+    __slots__ = (
+        "widths",
+        "labels",
+        "initial_hidden",
+        "key",
+        "on_change",
+        "return_widths",
+        "report_pixels",
+        "preset",
+        "_config",
+        "_columns_kwargs",
+    )
+
+    def __init__(
+        self,
+        spec=None,
+        *,
+        gap="small",
+        vertical_alignment="top",
+        border=False,
+        labels=None,
+        return_widths=False,
+        report_pixels=False,
+        initial_hidden=None,
+        key=None,
+        on_change=None,
+        live=False,
+        live_interval=0.25,
+        preset=None,
+    ):
+        widths = _parse_spec(spec)
+        labels = _resolve_labels(labels, len(widths))
+        initial_hidden = _resolve_initial_hidden(initial_hidden, len(widths))
+
+        if live_interval <= 0:
+            raise ValueError("live_interval must be a positive number of seconds")
+
+        self.widths = tuple(widths)
+        self.labels = intern_labels(labels)
+        self.initial_hidden = tuple(initial_hidden)
+        self.key = key
+        self.on_change = on_change
+        self.return_widths = return_widths
+        self.report_pixels = report_pixels
+        self.preset = preset
+
+        # Static part of the resizer component config, copied on every render
+        config = {"labels": list(self.labels), "gap": gap, "border": border}
+        if live:
+            config["live"] = True
+            config["liveInterval"] = int(live_interval * 1000)
+        if report_pixels:
+            # Ask the frontend to report pixel sizes whenever they differ
+            # from the ones we already know
+            config["reportPixels"] = True
+        if len(widths) >= _VIRTUAL_MIN_COLUMNS:
+            # A scrolling strip that only renders the handles in view, with
+            # widths exchanged in the compact encoding of state.py
+            config["virtual"] = True
+        self._config = config
+        self._columns_kwargs = _columns_kwargs(gap, vertical_alignment, border)
 
-    # Validate initial_hidden parameter
-    if initial_hidden is not None:
-        if len(initial_hidden) != len(widths):
-            raise ValueError(
-                "initial_hidden must have the same length as the number of columns"
+    def render(self):
+        """Render the resize handles and create the columns.
+
+        Returns the same value as adjustable_columns().
+        """
+        if self.key is None:
+            unique_id = _call_site_id(sys._getframe(1))
+        else:
+            unique_id = self.key
+        return self._render(unique_id)
+
+    def _render(self, unique_id):
+        # All state of the layout lives in one LayoutState object
+        state_key = _state_key(unique_id)
+        _track_state(unique_id, (state_key,))
+        state = _load_layout_state(
+            state_key,
+            self.widths,
+            self.initial_hidden,
+            self.labels,
+            unique_id,
+            self.preset,
+        )
+
+        preset = self.preset
+        if preset is not None:
+            preset = _apply_preset(preset, unique_id, state)
+
+        # Prepare configuration for the resizer component
+        hidden_columns = state.hidden
+        config = {**self._config, "version": state.version}
+        if "virtual" in config:
+            config["widths"] = encode_widths(state.widths)
+            config["hidden"] = encode_hidden(state.hidden_mask, state.count)
+        else:
+            config["widths"] = list(state.widths)
+            config["hidden"] = hidden_columns
+        if preset is not None:
+            config["presets"] = list(_presets.names)
+            config["preset"] = preset
+        if self.report_pixels:
+            config["containerWidth"] = state.container_width
+        config["fingerprint"] = _fingerprint(config)
+
+        # Create the resize handles component. When supported, the component
+        # value is committed to session state by an on_change callback before
+        # the script runs, so the widths sent here are already up to date.
+        component_key = f"resizer_{unique_id}"
+        component_kwargs = {}
+        if _component_supports_on_change():
+            component_kwargs["on_change"] = functools.partial(
+                _commit_component_value,
+                component_key,
+                state_key,
+                self.on_change,
+                layout_id=unique_id,
             )
-        if not all(isinstance(x, bool) for x in initial_hidden):
-            raise ValueError("initial_hidden must contain only boolean values")
-    else:
-        initial_hidden = [False] * len(widths)
 
-    # Create unique identifier for this set of columns
-    if key is None:
-        caller = inspect.currentframe().f_back
-        try:
-            src = f"{caller.f_code.co_filename}:{caller.f_lineno}"
-        finally:
-            del caller
-        unique_id = hashlib.md5(src.encode()).hexdigest()[:8]
-    else:
-        unique_id = key
+        component_value = _component_func(
+            config=config,
+            key=component_key,
+            default={"widths": config["widths"], "hidden": config["hidden"]},
+            height=_STRIP_HEIGHT,  # Compact height for just the resize handles
+            **component_kwargs,
+        )
 
-    # Create session state keys for storing current widths and hidden state
-    session_key = f"adjustable_columns_widths_{unique_id}"
-    hidden_key = f"adjustable_columns_hidden_{unique_id}"
+        # Update current widths and hidden state from component if it has been
+        # modified, ignoring values sent before a preset was applied
+        if component_value and _is_current(component_value, state):
+            if (
+                isinstance(component_value, dict)
+                and component_value.get("action") == "preset"
+            ):
+                preset_name = component_value["preset"]
+                if (
+                    not _component_supports_on_change()
+                    and st.session_state.get(_ACTIVE_PRESET_KEY) != preset_name
+                ):
+                    # Without on_change support the preset chosen from the
+                    # strip is only seen here, so apply it in a rerun
+                    st.session_state[_ACTIVE_PRESET_KEY] = preset_name
+                    if self.on_change is not None:
+                        self.on_change()
+                    st.rerun()
+            else:
+                needs_update = _store_component_value(component_value, state, unique_id)
+                hidden_columns = state.hidden
+                _store_geometry(component_value, state)
 
-    # Initialize or get current widths from session state
-    if session_key not in st.session_state:
-        st.session_state[session_key] = widths.copy()
+                if needs_update and not _component_supports_on_change():
+                    # Without on_change support the config above was sent with
+                    # the old widths, so force a rerun to update the layout
+                    if self.on_change is not None:
+                        self.on_change()
+                    st.rerun()
 
-    current_widths = st.session_state[session_key]
+        # Add CSS to ensure perfect alignment between resize handles and
+        # columns. The rules are page-wide, so they're emitted once per run.
+        _inject_alignment_css()
 
-    # Initialize or get hidden state from session state
-    if hidden_key not in st.session_state:
-        st.session_state[hidden_key] = initial_hidden.copy()
+        result = _create_columns(
+            list(state.widths),
+            hidden_columns,
+            columns_kwargs=self._columns_kwargs,
+            return_widths=self.return_widths,
+        )
+        if self.return_widths:
+            result["pixel_widths"] = (
+                None if state.pixel_widths is None else list(state.pixel_widths)
+            )
+            result["container_width"] = state.container_width
+            result["device_pixel_ratio"] = state.device_pixel_ratio
+        return result
 
-    hidden_columns = st.session_state[hidden_key]
 
-    # Ensure we have the right number of widths and hidden states (in case spec changed)
-    if len(current_widths) != len(widths):
-        current_widths = widths.copy()
-        st.session_state[session_key] = current_widths
+class LayoutSlot:
+    """A column set whose resize handles live in a shared adjustable_layouts() strip.
 
-    if len(hidden_columns) != len(widths):
-        hidden_columns = initial_hidden.copy()
-        st.session_state[hidden_key] = hidden_columns
+    Call :meth:`columns` at the place in the page where the columns should
+    appear.
+    """
 
-    # Prepare configuration for the resizer component
-    config = {
-        "widths": current_widths,
-        "labels": labels,
-        "gap": gap,
-        "border": border,
-        "hidden": hidden_columns,
-    }
+    def __init__(
+        self, widths, hidden, *, gap, vertical_alignment, border, return_widths
+    ):
+        self.widths = widths
+        self.hidden = hidden
+        self.gap = gap
+        self.vertical_alignment = vertical_alignment
+        self.border = border
+        self.return_widths = return_widths
+
+    def columns(self):
+        """Create the st.columns for this layout at the current position.
+
+        Returns the same value adjustable_columns() would: a list of column
+        containers, or a dict with 'columns', 'widths' and 'hidden' when the
+        layout was declared with return_widths=True.
+        """
+        return _create_columns(
+            self.widths,
+            self.hidden,
+            columns_kwargs=_columns_kwargs(
+                self.gap, self.vertical_alignment, self.border
+            ),
+            return_widths=self.return_widths,
+        )
 
-    # Create the resize handles component
+
+_LAYOUT_OPTIONS = {
+    "spec",
+    "gap",
+    "vertical_alignment",
+    "border",
+    "labels",
+    "return_widths",
+    "initial_hidden",
+    "key",
+}
+
+
+def adjustable_layouts(layouts, *, key=None, on_change=None):
+    """Create several sets of adjustable columns driven by a single component.
+
+    Every adjustable_columns() call loads its own component iframe. This
+    renders the resize handles of all ``layouts`` as stacked strips in one
+    iframe and returns their widths and hidden states in one component
+    value, which is considerably cheaper on pages with many column sets.
+
+    Parameters
+    ----------
+    layouts : list of dict
+        One dict per column set, holding the adjustable_columns() keyword
+        arguments ``spec``, ``gap``, ``vertical_alignment``, ``border``,
+        ``labels``, ``return_widths``, ``initial_hidden`` and ``key``. The
+        per-layout ``key`` only needs to be unique within this call and
+        defaults to the layout's position.
+    key : str, optional
+        An optional key that uniquely identifies this component.
+    on_change : callable, optional
+        An optional callback invoked when the user resizes, hides or shows a
+        column of any of the layouts.
+
+    Returns
+    -------
+    list of LayoutSlot
+        One slot per layout, in order. Call ``slot.columns()`` where the
+        columns should be placed; ``slot.widths`` and ``slot.hidden`` hold the
+        current state.
+
+    Examples
+    --------
+    >>> charts, tables = adjustable_layouts(
+    ...     [
+    ...         {"spec": [2, 1], "labels": ["Chart", "Legend"]},
+    ...         {"spec": 3, "labels": ["Orders", "Stock", "Alerts"]},
+    ...     ],
+    ...     key="control_room",
+    ... )
+    >>> st.subheader("Charts")
+    >>> chart_col, legend_col = charts.columns()
+    >>> st.subheader("Tables")
+    >>> orders_col, stock_col, alerts_col = tables.columns()
+    """
+    if not layouts:
+        raise ValueError("layouts must contain at least one layout")
+
+    # Create unique identifier for this batch of layouts
+    if key is None:
+        batch_id = _call_site_id(sys._getframe(1))
+    else:
+        batch_id = key
+
+    strips = []
+    state_keys = []
+    states = []
+    slots = []
+    for index, layout in enumerate(layouts):
+        unknown = set(layout) - _LAYOUT_OPTIONS
+        if unknown:
+            raise ValueError(f"Unknown layout option(s): {', '.join(sorted(unknown))}")
+
+        widths = _parse_spec(layout.get("spec"))
+        labels = _resolve_labels(layout.get("labels"), len(widths))
+        initial_hidden = _resolve_initial_hidden(
+            layout.get("initial_hidden"), len(widths)
+        )
+        gap = layout.get("gap", "small")
+        border = layout.get("border", False)
+
+        layout_id = f"{batch_id}_{layout.get('key', index)}"
+        state_key = _state_key(layout_id)
+        _track_state(layout_id, (state_key,))
+        state = _load_layout_state(state_key, widths, initial_hidden, labels, layout_id)
+
+        hidden_columns = state.hidden
+        strips.append(
+            {
+                "widths": list(state.widths),
+                "labels": list(state.labels),
+                "gap": gap,
+                "border": border,
+                "hidden": hidden_columns,
+            }
+        )
+        state_keys.append((state_key, layout_id))
+        states.append(state)
+        slots.append(
+            LayoutSlot(
+                list(state.widths),
+                hidden_columns,
+                gap=gap,
+                vertical_alignment=layout.get("vertical_alignment", "top"),
+                border=border,
+                return_widths=layout.get("return_widths", False),
+            )
+        )
+
+    component_key = f"resizer_{batch_id}"
+    component_kwargs = {}
+    if _component_supports_on_change():
+        component_kwargs["on_change"] = functools.partial(
+            _commit_batch_value, component_key, state_keys, on_change
+        )
+
+    config = {"layouts": strips}
+    config["fingerprint"] = _fingerprint(config)
     component_value = _component_func(
         config=config,
-        key=f"resizer_{unique_id}",
-        default={"widths": current_widths, "hidden": hidden_columns},
-        height=60,  # Compact height for just the resize handles
+        key=component_key,
+        default={
+            "layouts": [
+                {"widths": strip["widths"], "hidden": strip["hidden"]}
+                for strip in strips
+            ]
+        },
+        height=_STRIP_HEIGHT * len(strips),
+        **component_kwargs,
     )
 
-    # Update current widths and hidden state from component if it has been modified
     if component_value:
         needs_update = False
-
-        if "widths" in component_value:
-            new_widths = component_value["widths"]
-            if new_widths != current_widths:
-                st.session_state[session_key] = new_widths
-                current_widths = new_widths
-                needs_update = True
-
-        if "hidden" in component_value:
-            new_hidden = component_value["hidden"]
-            if new_hidden != hidden_columns:
-                st.session_state[hidden_key] = new_hidden
-                hidden_columns = new_hidden
+        for layout_value, (_, layout_id), state, slot in zip(
+            component_value.get("layouts", []), state_keys, states, slots
+        ):
+            if _store_component_value(layout_value, state, layout_id):
                 needs_update = True
+                slot.widths = list(state.widths)
+                slot.hidden = state.hidden
 
-        if needs_update:
-            # Force a rerun to update the column layout
+        if needs_update and not _component_supports_on_change():
+            if on_change is not None:
+                on_change()
             st.rerun()
 
-    # Add CSS to ensure perfect alignment between resize handles and columns
-    alignment_css = """
-    <style>
-    /* Ensure the resize handles iframe has no extra spacing */
-    iframe[title="streamlit_adjustable_columns.streamlit_adjustable_columns"] {
-        border: none !important;
-        background: transparent !important;
-        margin: 0 !important;
-        padding: 0 !important;
-    }
+    _inject_alignment_css()
 
-    /* Remove any extra margins from the element container holding the iframe */
-    .element-container:has(iframe[title="streamlit_adjustable_columns.streamlit_adjustable_columns"]) {
-        margin-bottom: 0 !important;
-    }
+    return slots
 
-    /* Ensure the following columns have proper spacing */
-    .element-container:has(iframe[title="streamlit_adjustable_columns.streamlit_adjustable_columns"]) + div[data-testid="column"] {
-        margin-top: 0 !important;
-    }
 
-    .element-container:has(iframe[title="streamlit_adjustable_columns.streamlit_adjustable_columns"]) + div[data-testid="column"] ~ div[data-testid="column"] {
-        margin-top: 0 !important;
-    }
-    </style>
+def adjustable_grid(
+    rows=2,
+    cols=2,
+    *,
+    height=600,
+    gap="small",
+    vertical_alignment="top",
+    border=True,
+    row_labels=None,
+    col_labels=None,
+    return_widths=False,
+    key=None,
+    on_change=None,
+):
+    """Create a grid of cells with adjustable column widths and row heights.
+
+    Column widths and row heights are kept in one session state object and
+    driven by a single component showing a strip of column handles and a
+    strip of row handles, so re-laying out the whole grid costs one component
+    round trip instead of one per nested adjustable_columns() strip.
+
+    Requires a Streamlit version that supports ``st.container(height=...)``.
+
+    Parameters
+    ----------
+    rows : int or Iterable of numbers, default 2
+        The number of rows, or their relative heights.
+    cols : int or Iterable of numbers, default 2
+        The number of columns, or their relative widths.
+    height : int, default 600
+        The total height of the grid in pixels, shared between the rows.
+    gap : {"small", "medium", "large"}, default "small"
+        The size of the gap between the columns.
+    vertical_alignment : {"top", "center", "bottom"}, default "top"
+        The vertical alignment of the content inside the columns.
+    border : bool, default True
+        Whether to show a border around each cell.
+    row_labels : list of str, optional
+        Labels for the row handles. If None, defaults to "Row 1", "Row 2", etc.
+    col_labels : list of str, optional
+        Labels for the column handles. If None, defaults to "Col 1", "Col 2", etc.
+    return_widths : bool, default False
+        If True, returns a dict with 'cells', 'widths', 'heights' and 'hidden'
+        keys. If False, returns just the cells.
+    key : str, optional
+        An optional key that uniquely identifies this component.
+    on_change : callable, optional
+        An optional callback invoked when the user resizes a row or column,
+        or hides or shows a column.
+
+    Returns
+    -------
+    list of lists of containers or dict
+        If return_widths=False: One list of cell containers per row.
+        If return_widths=True: A dict with keys:
+            - 'cells': One list of cell containers per row
+            - 'widths': Current width ratios of the columns
+            - 'heights': Current height ratios of the rows
+            - 'hidden': List of boolean values indicating which columns are hidden
+
+    Examples
+    --------
+    >>> grid = adjustable_grid(2, [2, 1], col_labels=["Chart", "Details"])
+    >>> grid[0][0].line_chart(data)
+    >>> with grid[1][1]:
+    ...     st.write("Bottom right")
     """
+    widths = _parse_spec(cols)
+    heights = _parse_spec(rows)
+    col_labels = _resolve_labels(col_labels, len(widths))
+    if row_labels is None:
+        row_labels = [f"Row {i+1}" for i in range(len(heights))]
+    elif len(row_labels) != len(heights):
+        raise ValueError("row_labels must have the same length as the number of rows")
 
-    st.markdown(alignment_css, unsafe_allow_html=True)
+    # Create unique identifier for this grid
+    if key is None:
+        unique_id = _call_site_id(sys._getframe(1))
+    else:
+        unique_id = key
 
-    # Create the actual Streamlit columns with current widths
-    # Ensure each column is at least 6% of total width
-    MIN_WIDTH_RATIO = 0.06
-    total_width = sum(current_widths)
-    min_width_absolute = MIN_WIDTH_RATIO * total_width
+    # Widths, heights and hidden flags are kept together in one state object
+    state_key = f"adjustable_grid_{unique_id}"
+    _track_state(state_key, (state_key,))
+    state = st.session_state.get(state_key)
+    if state is None:
+        state = _load_persisted(state_key)
+    if (
+        state is None
+        or len(state["widths"]) != len(widths)
+        or len(state["heights"]) != len(heights)
+    ):
+        state = {
+            "widths": widths,
+            "heights": heights,
+            "hidden": [False] * len(widths),
+        }
+    # Also stores a state loaded from the layout store, for the on_change
+    # callback of the next change
+    st.session_state[state_key] = state
 
-    streamlit_widths = [max(width, min_width_absolute) for width in current_widths]
+    component_key = f"resizer_{unique_id}"
+    component_kwargs = {}
+    if _component_supports_on_change():
+        component_kwargs["on_change"] = functools.partial(
+            _commit_grid_value, component_key, state_key, on_change
+        )
 
-    # Create the actual st.columns with all supported parameters
-    st_columns = st.columns(
-        spec=streamlit_widths,
-        gap=gap,
-        vertical_alignment=vertical_alignment,
-        border=border,
+    config = {
+        "grid": {
+            "widths": state["widths"],
+            "heights": state["heights"],
+            "hidden": state["hidden"],
+            "colLabels": col_labels,
+            "rowLabels": row_labels,
+            "gap": gap,
+            "border": border,
+        }
+    }
+    config["fingerprint"] = _fingerprint(config)
+    component_value = _component_func(
+        config=config,
+        key=component_key,
+        default=state,
+        height=_STRIP_HEIGHT * 2,  # One strip for columns, one for rows
+        **component_kwargs,
     )
 
-    # Wrap columns with HidableContainer based on hidden state
-    wrapped_columns = [
-        HidableContainer(col, is_hidden=hidden)
-        for col, hidden in zip(st_columns, hidden_columns)
+    if component_value:
+        new_state = _grid_state_from_value(component_value, state)
+        if new_state != state:
+            st.session_state[state_key] = state = new_state
+            _persist(state_key, new_state)
+            if not _component_supports_on_change():
+                if on_change is not None:
+                    on_change()
+                st.rerun()
+
+    _inject_alignment_css()
+
+    # Share the grid height between the rows, keeping every row at least
+    # MIN_WIDTH_RATIO of the total like the columns
+    total_height = sum(state["heights"])
+    row_heights = [
+        max(int(height * max(h / total_height, MIN_WIDTH_RATIO)), 1)
+        for h in state["heights"]
     ]
 
-    # Return based on return_widths parameter
+    total_width = sum(state["widths"])
+    min_width_absolute = MIN_WIDTH_RATIO * total_width
+    streamlit_widths = [max(width, min_width_absolute) for width in state["widths"]]
+
+    # Borders go on the cell containers, not on the columns
+    columns_kwargs = _columns_kwargs(gap, vertical_alignment)
+
+    cells = []
+    for row_height in row_heights:
+        st_columns = st.columns(spec=streamlit_widths, **columns_kwargs)
+        row = [col.container(height=row_height, border=border) for col in st_columns]
+        if any(state["hidden"]):
+            row = [
+                HidableContainer(cell, is_hidden=hidden)
+                for cell, hidden in zip(row, state["hidden"])
+            ]
+        cells.append(row)
+
     if return_widths:
         return {
-            "columns": wrapped_columns,
-            "widths": current_widths,
-            "hidden": hidden_columns,
+            "cells": cells,
+            "widths": state["widths"],
+            "heights": state["heights"],
+            "hidden": state["hidden"],
         }
     else:
-        return wrapped_columns
+        return cells
@@ -1,42 +1,110 @@
-// Import Streamlit's component base
-import { Streamlit } from "streamlit-component-lib"
+// Minimal implementation of the Streamlit component protocol
+import { Streamlit } from "./streamlit.js"
+
+// Height of one strip of resize handles, matching _STRIP_HEIGHT in Python
+const STRIP_HEIGHT = 60
+
+// Live mode bookkeeping, shared by all strips of this iframe. A value sent
+// while dragging triggers a rerun; until that rerun renders us again (or the
+// request goes stale) further intermediate values are held back.
+const STALE_RERUN_MS = 2000
+let rerunInFlightSince = 0
+let dragInProgress = false
+let onRerunRendered = null
+
+function isRerunInFlight() {
+    return rerunInFlightSince > 0 && Date.now() - rerunInFlightSince < STALE_RERUN_MS
+}
+
+// Compact encoding used for large layouts, matching encode_widths() and
+// encode_hidden() in state.py: base64 of little-endian float32 widths, and
+// base64 of a bitmask with bit i set when column i is hidden
+function toBase64(bytes) {
+    let binary = ""
+    for (let i = 0; i < bytes.length; i++) binary += String.fromCharCode(bytes[i])
+    return btoa(binary)
+}
+
+function fromBase64(data) {
+    return Uint8Array.from(atob(data), c => c.charCodeAt(0))
+}
+
+function encodeWidths(widths) {
+    const view = new DataView(new ArrayBuffer(widths.length * 4))
+    for (let i = 0; i < widths.length; i++) view.setFloat32(i * 4, widths[i], true)
+    return toBase64(new Uint8Array(view.buffer))
+}
+
+function decodeWidths(data) {
+    const bytes = fromBase64(data)
+    const view = new DataView(bytes.buffer)
+    const widths = new Float64Array(bytes.length / 4)
+    for (let i = 0; i < widths.length; i++) widths[i] = view.getFloat32(i * 4, true)
+    return widths
+}
+
+function encodeHidden(hidden) {
+    const bytes = new Uint8Array(Math.ceil(hidden.length / 8))
+    hidden.forEach((isHidden, i) => {
+        if (isHidden) bytes[i >> 3] |= 1 << (i & 7)
+    })
+    return toBase64(bytes)
+}
+
+function decodeHidden(data, count) {
+    const bytes = fromBase64(data)
+    return Array.from({ length: count }, (_, i) => Boolean(bytes[i >> 3] & (1 << (i & 7))))
+}
 
 /**
  * Creates resize handles positioned at exact column boundaries
+ *
+ * Renders one strip of handles for a single column set into `parent`.
+ * `commit(widths, hidden, action, geometry, extra)` is called when the user
+ * finishes a resize or toggles a column, with the "measure" action when
+ * `config.reportPixels` is set and the rendered pixel sizes have changed, and
+ * with the "preset" action and `extra.preset` when a preset is chosen from
+ * the menu shown for `config.presets`.
+ *
+ * With `config.virtual` (sent by Python for layouts with many columns) the
+ * widths and hidden flags arrive in the compact encoding above, the strip
+ * scrolls horizontally and only the columns in view have DOM nodes.
+ *
+ * Returns a function that removes the strip again, releasing its observer,
+ * timers and listeners.
  */
-function onRender(event) {
-    const data = event.detail
-    const config = data.args.config
-    const widths = config.widths
-    const labels = config.labels || widths.map((_, i) => `Col ${i+1}`)
+function renderStrip(parent, config, theme, commit) {
+    const virtual = config.virtual || false
+    const widths = virtual ? decodeWidths(config.widths) : config.widths
+    const count = widths.length
+    const labels = config.labels || Array.from(widths, (_, i) => `Col ${i+1}`)
     const gap = config.gap || "small"
     const border = config.border || false
-    const hidden = config.hidden || widths.map(() => false)
-    
-    // Minimum width constraint: 6% for all columns
-    const MIN_WIDTH_RATIO = 0.06
+    const hidden = virtual
+        ? decodeHidden(config.hidden, count)
+        : (config.hidden || Array.from(widths, () => false))
+    // Row strips of a grid can be resized but not hidden
+    const hidable = config.hidable !== false
+    // Stream widths while dragging, at most once every liveInterval ms
+    const live = config.live || false
+    const liveInterval = config.liveInterval || 250
     
-    // Clear the container
-    const container = document.getElementById("root")
-    container.innerHTML = ""
+    // Minimum width constraint: 6% for all columns, or half the average
+    // width when there are too many columns for 6% each
+    const MIN_WIDTH_RATIO = virtual ? Math.min(0.06, 0.5 / count) : 0.06
     
     // Store current state
-    let currentWidths = [...widths]
+    let currentWidths = Float64Array.from(widths)
     let currentHidden = [...hidden]
     let isResizing = false
+    let dragPointerId = null
+    let dragFrame = 0
+    let dragClientX = 0
+    let dragWidth = 0
     let startX = 0
-    let startWidths = []
+    let startWidths = currentWidths
     let resizingIndex = -1
     
-    // Get Streamlit theme colors
-    const theme = {
-        primary: getComputedStyle(document.documentElement).getPropertyValue('--primary-color') || '#ff6b6b',
-        background: getComputedStyle(document.documentElement).getPropertyValue('--background-color') || '#ffffff',
-        secondary: getComputedStyle(document.documentElement).getPropertyValue('--secondary-background-color') || '#f0f2f6',
-        text: getComputedStyle(document.documentElement).getPropertyValue('--text-color') || '#262730',
-        border: getComputedStyle(document.documentElement).getPropertyValue('--border-color') || '#e6eaf1'
-    }
-    
     // Gap sizes that match Streamlit exactly (from CSS inspection)
     const gapSizes = {
         small: 8,   // 0.5rem = 8px
@@ -46,18 +114,48 @@ function onRender(event) {
     
     const gapPixels = gapSizes[gap]
     
-    // Create main container
+    // Create main container. The browser lays the strip out as a grid whose
+    // tracks alternate between columns, sized by their width ratios, and the
+    // gaps holding the handles. The tracks come from the --tracks custom
+    // property, so page resizes need no script work and drags only update
+    // that one property.
+    //
+    // A virtual strip is instead a horizontally scrolling viewport over a
+    // wider `content` element, in which the columns in view are positioned
+    // absolutely.
     const handleContainer = document.createElement("div")
     handleContainer.className = "resize-handle-container"
-    handleContainer.style.cssText = `
-        position: relative;
-        width: 100%;
-        height: 40px;
-        background: transparent;
-        margin-bottom: 8px;
-    `
+    let content = handleContainer
+    if (virtual) {
+        handleContainer.style.cssText = `
+            position: relative;
+            width: 100%;
+            overflow-x: auto;
+            overflow-y: hidden;
+            scrollbar-width: thin;
+            background: transparent;
+        `
+        content = document.createElement("div")
+        content.style.cssText = `
+            position: relative;
+            height: 40px;
+        `
+        handleContainer.appendChild(content)
+    } else {
+        handleContainer.style.cssText = `
+            position: relative;
+            display: grid;
+            grid-template-columns: var(--tracks);
+            grid-template-rows: 100%;
+            width: 100%;
+            height: 40px;
+            background: transparent;
+            margin-bottom: 8px;
+        `
+    }
     
-    // Calculate column positions based on widths and gaps
+    // Calculate column pixel positions based on widths and gaps, for the
+    // geometry reported to Python
     function calculateColumnPositions(containerWidth) {
         const totalWidth = currentWidths.reduce((sum, w) => sum + w, 0)
         const totalGapWidth = (currentWidths.length - 1) * gapPixels
@@ -79,231 +177,455 @@ function onRender(event) {
         return positions
     }
     
-    // Create column indicators and resize handles
-    function updateLayout() {
-        handleContainer.innerHTML = ""
-        const containerWidth = handleContainer.offsetWidth || 800 // fallback
-        const positions = calculateColumnPositions(containerWidth)
-        
-        // Create a single, shared tooltip that is not constrained by column width
-        const tooltip = document.createElement("div")
-        tooltip.textContent = "Double-click to hide/show column"
-        tooltip.style.cssText = `
-            position: absolute;
-            top: -2px; /* Position it in the margin space above the indicators */
-            left: 0; /* Will be updated on hover */
-            transform: translateX(-50%);
-            background: ${theme.text};
-            color: ${theme.background};
-            padding: 6px 10px;
-            border-radius: 6px;
+    // Pixel geometry of the Streamlit columns. They span the whole iframe
+    // width, while the handle strip is inset by the #root padding.
+    function measure() {
+        const containerWidth = document.documentElement.clientWidth || handleContainer.offsetWidth
+        return {
+            containerWidth: containerWidth,
+            pixelWidths: calculateColumnPositions(containerWidth).map(pos => pos.width),
+            devicePixelRatio: window.devicePixelRatio || 1
+        }
+    }
+    
+    // Report the pixel geometry when it differs from what Python knows
+    let measureTimer = null
+    function reportGeometry() {
+        if (!config.reportPixels || isResizing) return
+        const geometry = measure()
+        if (geometry.containerWidth === config.containerWidth) return
+        config.containerWidth = geometry.containerWidth
+        send("measure", geometry)
+    }
+    
+    // Report the current state to Python
+    function send(action, geometry, extra) {
+        commit(Array.from(currentWidths), currentHidden, action, geometry, extra)
+    }
+    
+    // Throttled live updates: leading edge when the interval has passed,
+    // trailing edge via a timer, and values are dropped while a rerun is
+    // in flight (the latest one is sent once it has rendered)
+    let lastLiveSent = 0
+    let liveTimer = null
+    let livePending = false
+    
+    function sendLive() {
+        clearTimeout(liveTimer)
+        liveTimer = null
+        if (!isResizing) return
+        if (isRerunInFlight()) {
+            livePending = true
+            return
+        }
+        livePending = false
+        lastLiveSent = Date.now()
+        rerunInFlightSince = lastLiveSent
+        send("drag", measure())
+    }
+    
+    function scheduleLive() {
+        if (!live) return
+        const wait = liveInterval - (Date.now() - lastLiveSent)
+        if (wait <= 0) {
+            sendLive()
+        } else if (!liveTimer) {
+            liveTimer = setTimeout(sendLive, wait)
+        }
+    }
+    
+    // Background of a column indicator for its hidden and hover state
+    function indicatorBackground(index, hover) {
+        if (currentHidden[index]) {
+            return hover ? 'rgba(255, 107, 107, 0.2)' : 'rgba(255, 107, 107, 0.1)'
+        }
+        if (border) {
+            return hover ? 'rgba(230, 234, 241, 0.2)' : 'rgba(230, 234, 241, 0.1)'
+        }
+        return hover ? 'rgba(100, 100, 100, 0.1)' : 'rgba(100, 100, 100, 0.05)'
+    }
+    
+    // The strip is built once. Resizing, dragging and toggling only update
+    // the existing nodes, and all pointer events go through delegated
+    // listeners on handleContainer. A virtual strip recycles the nodes of
+    // columns scrolling out of view for the ones scrolling in.
+    
+    // A single, shared tooltip that is not constrained by column width
+    const tooltip = document.createElement("div")
+    tooltip.textContent = "Double-click to hide/show column"
+    tooltip.style.cssText = `
+        position: absolute;
+        top: -2px; /* Position it in the margin space above the indicators */
+        left: 0; /* Will be updated on hover */
+        transform: translateX(-50%);
+        background: ${theme.text};
+        color: ${theme.background};
+        padding: 6px 10px;
+        border-radius: 6px;
+        font-size: 11px;
+        white-space: nowrap;
+        opacity: 0;
+        pointer-events: none;
+        transition: opacity 0.2s ease, transform 0.1s ease;
+        z-index: 9999;
+        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
+        font-weight: 500;
+    `
+    content.appendChild(tooltip)
+    
+    // Nodes of the rendered columns and handles, by index
+    const columns = new Map()
+    const handles = new Map()
+    
+    // A column indicator with its label and hidden icon
+    function createColumn() {
+        const indicator = document.createElement("div")
+        indicator.className = "column-indicator"
+        indicator.style.cssText = `
+            ${virtual ? 'position: absolute; top: 0; height: 100%;' : 'position: relative; grid-row: 1;'}
+            min-width: 0;
+            ${border ? 'border: 1px dashed rgba(230, 234, 241, 0.3);' : ''}
+            border-radius: 4px;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            transition: background 0.15s ease;
+            box-sizing: border-box;
+            cursor: pointer;
+            user-select: none;
+        `
+        
+        const label = document.createElement("div")
+        label.style.cssText = `
             font-size: 11px;
+            font-weight: 500;
+            pointer-events: none;
             white-space: nowrap;
-            opacity: 0;
+            overflow: hidden;
+            text-overflow: ellipsis;
+            max-width: 90%;
+        `
+        indicator.appendChild(label)
+        
+        const hiddenIcon = document.createElement("div")
+        hiddenIcon.textContent = "👁️"
+        hiddenIcon.style.cssText = `
+            position: absolute;
+            top: 2px;
+            right: 4px;
+            font-size: 10px;
+            opacity: 0.7;
             pointer-events: none;
-            transition: opacity 0.2s ease, transform 0.1s ease;
-            z-index: 9999;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
-            font-weight: 500;
         `
-        handleContainer.appendChild(tooltip)
-        
-        positions.forEach((pos, index) => {
-            // Create column indicator
-            const indicator = document.createElement("div")
-            indicator.className = "column-indicator"
-            indicator.style.cssText = `
-                position: absolute;
-                left: ${pos.start}px;
-                width: ${pos.width}px;
-                height: 100%;
-                background: ${currentHidden[index] ? 'rgba(255, 107, 107, 0.1)' : (border ? 'rgba(230, 234, 241, 0.1)' : 'rgba(100, 100, 100, 0.05)')};
-                ${border ? 'border: 1px dashed rgba(230, 234, 241, 0.3);' : ''}
-                border-radius: 4px;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                transition: background 0.15s ease;
-                box-sizing: border-box;
-                cursor: pointer;
-                user-select: none;
-            `
-            
-            // Add label
-            const label = document.createElement("div")
-            label.textContent = labels[index]
-            label.style.cssText = `
-                font-size: 11px;
-                color: ${currentHidden[index] ? theme.primary : theme.text + '60'};
-                font-weight: 500;
-                opacity: ${currentHidden[index] ? '0.8' : '0.7'};
-                pointer-events: none;
-                white-space: nowrap;
-                overflow: hidden;
-                text-overflow: ellipsis;
-                max-width: 90%;
-            `
-            
-            indicator.appendChild(label)
-            
-            // Add hidden indicator
-            if (currentHidden[index]) {
-                const hiddenIcon = document.createElement("div")
-                hiddenIcon.innerHTML = "👁️"
-                hiddenIcon.style.cssText = `
-                    position: absolute;
-                    top: 2px;
-                    right: 4px;
-                    font-size: 10px;
-                    opacity: 0.7;
-                    pointer-events: none;
-                `
-                indicator.appendChild(hiddenIcon)
+        indicator.appendChild(hiddenIcon)
+        
+        content.appendChild(indicator)
+        return { indicator, label, hiddenIcon }
+    }
+    
+    // A resize handle at the boundary after a column
+    function createHandle() {
+        const handle = document.createElement("div")
+        handle.className = "resize-handle"
+        handle.style.cssText = `
+            ${virtual ? 'position: absolute; top: 0; margin-left: -4px;' : 'grid-row: 1; justify-self: center;'}
+            width: 8px;
+            touch-action: none;
+            height: 100%;
+            cursor: col-resize;
+            z-index: 1001;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            border-radius: 4px;
+            transition: all 0.15s ease;
+            background: transparent;
+        `
+        
+        // Visual handle bar
+        const bar = document.createElement("div")
+        bar.style.cssText = `
+            width: 2px;
+            height: 70%;
+            background: ${theme.text}40;
+            border-radius: 1px;
+            transition: all 0.15s ease;
+        `
+        handle.appendChild(bar)
+        
+        content.appendChild(handle)
+        return { handle, bar }
+    }
+    
+    function showColumn(record, index) {
+        record.indicator.dataset.index = index
+        record.label.textContent = labels[index]
+        columns.set(index, record)
+        updateColumn(index, false)
+    }
+    
+    function showHandle(record, index) {
+        record.handle.dataset.index = index
+        handles.set(index, record)
+        updateHandle(index, isResizing && index === resizingIndex)
+    }
+    
+    if (!virtual) {
+        for (let index = 0; index < count; index++) {
+            const record = createColumn()
+            record.indicator.style.gridColumn = 2 * index + 1
+            showColumn(record, index)
+            if (index < count - 1) {
+                const handleRecord = createHandle()
+                handleRecord.handle.style.gridColumn = 2 * index + 2
+                showHandle(handleRecord, index)
             }
+        }
+    }
+    
+    // Show a column's hidden state and (unless a drag is running) hover state
+    function updateColumn(index, hover) {
+        const record = columns.get(index)
+        if (!record) return
+        const { indicator, label, hiddenIcon } = record
+        indicator.style.background = indicatorBackground(index, hover)
+        label.style.color = currentHidden[index] ? theme.primary : theme.text + '60'
+        label.style.opacity = hover ? '1' : (currentHidden[index] ? '0.8' : '0.7')
+        hiddenIcon.style.display = currentHidden[index] ? '' : 'none'
+    }
+    
+    function updateHandle(index, active) {
+        const record = handles.get(index)
+        if (!record) return
+        const { handle, bar } = record
+        bar.style.background = active ? theme.primary : `${theme.text}40`
+        bar.style.width = active ? '4px' : '2px'
+        handle.style.background = active ? `${theme.primary}15` : 'transparent'
+    }
+    
+    // Geometry of a virtual strip: every column gets VIRTUAL_COLUMN_PX on
+    // average, and starts[i] is the left edge of column i in `content`
+    const VIRTUAL_COLUMN_PX = 80
+    const OVERSCAN_PX = 200
+    const starts = new Float64Array(count)
+    const spareColumns = []
+    const spareHandles = []
+    let viewportWidth = 0
+    let contentWidth = 0
+    let pixelsPerRatio = 0
+    let scrollFrame = 0
+    
+    // Index of the last column starting at or before x
+    function columnAt(x) {
+        let low = 0
+        let high = count - 1
+        while (low < high) {
+            const mid = (low + high + 1) >> 1
+            if (starts[mid] <= x) low = mid
+            else high = mid - 1
+        }
+        return low
+    }
+    
+    // Give the columns and handles in view (plus some overscan) a node, and
+    // position them
+    function renderVisible() {
+        scrollFrame = 0
+        const scrollLeft = handleContainer.scrollLeft
+        const first = columnAt(scrollLeft - OVERSCAN_PX)
+        const last = columnAt(scrollLeft + viewportWidth + OVERSCAN_PX)
+        
+        // Recycle the nodes that went out of view. The dragged handle keeps
+        // its node, which holds the pointer capture of the drag.
+        const pinned = isResizing ? resizingIndex : -1
+        columns.forEach((record, index) => {
+            if (index >= first && index <= last) return
+            columns.delete(index)
+            record.indicator.style.display = 'none'
+            spareColumns.push(record)
+        })
+        handles.forEach((record, index) => {
+            if ((index >= first && index < last) || index === pinned) return
+            handles.delete(index)
+            record.handle.style.display = 'none'
+            spareHandles.push(record)
+        })
+        
+        content.style.width = `${contentWidth}px`
+        for (let index = first; index <= last; index++) {
+            let record = columns.get(index)
+            if (!record) {
+                record = spareColumns.pop() || createColumn()
+                record.indicator.style.display = 'flex'
+                showColumn(record, index)
+            }
+            record.indicator.style.left = `${starts[index]}px`
+            record.indicator.style.width = `${currentWidths[index] * pixelsPerRatio}px`
             
-            // Show tooltip on hover
-            indicator.addEventListener('mouseenter', () => {
-                if (!isResizing) {
-                    indicator.style.background = currentHidden[index] ? 
-                        'rgba(255, 107, 107, 0.2)' : 
-                        (border ? 'rgba(230, 234, 241, 0.2)' : 'rgba(100, 100, 100, 0.1)')
-                    label.style.opacity = '1'
-                    
-                    // Position and show the shared tooltip, ensuring it's not clipped
-                    const containerWidth = handleContainer.offsetWidth;
-                    const tooltipWidth = tooltip.offsetWidth;
-                    let targetLeft = pos.start + pos.width / 2;
-
-                    // Adjust position to prevent clipping at the component edges
-                    if (targetLeft - tooltipWidth / 2 < 0) {
-                        // Nudge right if clipped on the left
-                        targetLeft = tooltipWidth / 2;
-                    } else if (targetLeft + tooltipWidth / 2 > containerWidth) {
-                        // Nudge left if clipped on the right
-                        targetLeft = containerWidth - tooltipWidth / 2;
-                    }
-                    
-                    tooltip.style.left = `${targetLeft}px`;
-                    tooltip.style.opacity = '1'
-                }
-            })
-            
-            indicator.addEventListener('mouseleave', () => {
-                if (!isResizing) {
-                    indicator.style.background = currentHidden[index] ? 
-                        'rgba(255, 107, 107, 0.1)' : 
-                        (border ? 'rgba(230, 234, 241, 0.1)' : 'rgba(100, 100, 100, 0.05)')
-                    label.style.opacity = currentHidden[index] ? '0.8' : '0.7'
-                    tooltip.style.opacity = '0'
-                }
-            })
-            
-            // Double-click to hide/show column
-            let clickCount = 0
-            let clickTimer = null
-            
-            indicator.addEventListener('click', () => {
-                clickCount++
-                if (clickCount === 1) {
-                    clickTimer = setTimeout(() => {
-                        clickCount = 0
-                    }, 300)
-                } else if (clickCount === 2) {
-                    clearTimeout(clickTimer)
-                    clickCount = 0
-                    
-                    // Toggle hidden state
-                    currentHidden[index] = !currentHidden[index]
-                    
-                    // Send updated hidden state to Streamlit
-                    Streamlit.setComponentValue({
-                        widths: currentWidths,
-                        hidden: currentHidden,
-                        action: "toggle_hidden"
-                    })
-                }
-            })
-            
-            handleContainer.appendChild(indicator)
-            
-            // Create resize handle at the boundary (except for last column)
-            if (index < positions.length - 1) {
-                const handle = document.createElement("div")
-                handle.className = "resize-handle"
-                handle.style.cssText = `
-                    position: absolute;
-                    left: ${pos.end + gapPixels / 2 - 4}px;
-                    top: 0;
-                    width: 8px;
-                    height: 100%;
-                    cursor: col-resize;
-                    z-index: 1001;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    border-radius: 4px;
-                    transition: all 0.15s ease;
-                    background: transparent;
-                `
-                
-                // Visual handle bar
-                const handleBar = document.createElement("div")
-                handleBar.style.cssText = `
-                    width: 2px;
-                    height: 70%;
-                    background: ${theme.text}40;
-                    border-radius: 1px;
-                    transition: all 0.15s ease;
-                `
-                
-                handle.appendChild(handleBar)
-                handle.dataset.index = index
-                
-                // Handle events
-                handle.addEventListener('mouseenter', () => {
-                    if (!isResizing) {
-                        handleBar.style.background = theme.primary
-                        handleBar.style.width = '4px'
-                        handle.style.background = `${theme.primary}15`
-                    }
-                })
-                
-                handle.addEventListener('mouseleave', () => {
-                    if (!isResizing) {
-                        handleBar.style.background = `${theme.text}40`
-                        handleBar.style.width = '2px'
-                        handle.style.background = 'transparent'
-                    }
-                })
-                
-                handle.addEventListener('mousedown', (e) => startResize(e, handle, handleBar))
-                
-                handleContainer.appendChild(handle)
+            if (index === last) continue
+            let handleRecord = handles.get(index)
+            if (!handleRecord) {
+                handleRecord = spareHandles.pop() || createHandle()
+                handleRecord.handle.style.display = 'flex'
+                showHandle(handleRecord, index)
             }
-        })
+            handleRecord.handle.style.left = `${starts[index + 1] - gapPixels / 2}px`
+        }
+        if (pinned >= 0 && (pinned < first || pinned >= last)) {
+            handles.get(pinned).handle.style.left = `${starts[pinned + 1] - gapPixels / 2}px`
+        }
+    }
+    
+    // Size the grid tracks to the current widths. minmax(0, ...) keeps long
+    // labels from widening their column.
+    function updateLayout() {
+        if (virtual) {
+            const totalGapWidth = (count - 1) * gapPixels
+            const totalWidth = currentWidths.reduce((sum, w) => sum + w, 0)
+            contentWidth = Math.max(viewportWidth, count * VIRTUAL_COLUMN_PX + totalGapWidth)
+            pixelsPerRatio = (contentWidth - totalGapWidth) / totalWidth
+            let x = 0
+            for (let i = 0; i < count; i++) {
+                starts[i] = x
+                x += currentWidths[i] * pixelsPerRatio + gapPixels
+            }
+            renderVisible()
+            return
+        }
+        const tracks = Array.from(currentWidths, w => `minmax(0, ${w}fr)`).join(` ${gapPixels}px `)
+        handleContainer.style.setProperty('--tracks', tracks)
+    }
+    
+    // Find the indicator or handle an event happened on
+    function eventTarget(node) {
+        const element = node && node.closest ? node.closest('.column-indicator, .resize-handle') : null
+        if (!element || !handleContainer.contains(element)) return null
+        return {
+            element: element,
+            index: parseInt(element.dataset.index),
+            isHandle: element.classList.contains('resize-handle')
+        }
     }
     
-    function startResize(e, handle, handleBar) {
+    // Hover effects, emulating mouseenter/mouseleave of each element
+    handleContainer.addEventListener('mouseover', (e) => {
+        const target = eventTarget(e.target)
+        if (!target || isResizing || target.element.contains(e.relatedTarget)) return
+        
+        if (target.isHandle) {
+            updateHandle(target.index, true)
+            return
+        }
+        updateColumn(target.index, true)
+        
+        // Position and show the shared tooltip, ensuring it's not clipped
+        const indicator = target.element
+        const viewLeft = handleContainer.scrollLeft
+        const viewRight = viewLeft + handleContainer.clientWidth
+        const tooltipWidth = tooltip.offsetWidth
+        let targetLeft = indicator.offsetLeft + indicator.offsetWidth / 2
+        
+        // Adjust position to prevent clipping at the component edges
+        if (targetLeft - tooltipWidth / 2 < viewLeft) {
+            // Nudge right if clipped on the left
+            targetLeft = viewLeft + tooltipWidth / 2
+        } else if (targetLeft + tooltipWidth / 2 > viewRight) {
+            // Nudge left if clipped on the right
+            targetLeft = viewRight - tooltipWidth / 2
+        }
+        
+        tooltip.style.left = `${targetLeft}px`
+        if (hidable) tooltip.style.opacity = '1'
+    })
+    
+    handleContainer.addEventListener('mouseout', (e) => {
+        const target = eventTarget(e.target)
+        if (!target || isResizing || target.element.contains(e.relatedTarget)) return
+        
+        if (target.isHandle) {
+            updateHandle(target.index, false)
+        } else {
+            updateColumn(target.index, false)
+            tooltip.style.opacity = '0'
+        }
+    })
+    
+    // Double-click to hide/show column
+    let clickCount = 0
+    let clickIndex = -1
+    let clickTimer = null
+    
+    handleContainer.addEventListener('click', (e) => {
+        const target = eventTarget(e.target)
+        if (!hidable || !target || target.isHandle) return
+        
+        if (target.index !== clickIndex) {
+            clickCount = 0
+            clickIndex = target.index
+        }
+        clickCount++
+        if (clickCount === 1) {
+            clearTimeout(clickTimer)
+            clickTimer = setTimeout(() => {
+                clickCount = 0
+            }, 300)
+        } else if (clickCount === 2) {
+            clearTimeout(clickTimer)
+            clickCount = 0
+            
+            // Toggle hidden state
+            currentHidden[target.index] = !currentHidden[target.index]
+            updateColumn(target.index, true)
+            
+            // Send updated hidden state to Streamlit
+            send("toggle_hidden", measure())
+        }
+    })
+    
+    // Drags follow one pointer, captured by its handle so that moves outside
+    // the iframe still reach us. Only pointerdown is not passive, to prevent
+    // text selection.
+    handleContainer.addEventListener('pointerdown', (e) => {
+        const target = eventTarget(e.target)
+        if (!target || !target.isHandle || e.button !== 0 || isResizing) return
+        target.element.setPointerCapture(e.pointerId)
+        startResize(e, target.index)
+    })
+    handleContainer.addEventListener('pointermove', handleResize, { passive: true })
+    handleContainer.addEventListener('pointerup', stopResize, { passive: true })
+    handleContainer.addEventListener('pointercancel', stopResize, { passive: true })
+    handleContainer.addEventListener('lostpointercapture', stopResize, { passive: true })
+    
+    function startResize(e, index) {
         isResizing = true
+        dragPointerId = e.pointerId
+        dragInProgress = true
+        onRerunRendered = () => {
+            if (livePending) scheduleLive()
+        }
         startX = e.clientX
-        resizingIndex = parseInt(handle.dataset.index)
+        dragClientX = e.clientX
+        // The only layout read of the drag. A virtual strip's content width
+        // is known, and doesn't change while dragging.
+        dragWidth = virtual ? contentWidth : handleContainer.clientWidth
+        resizingIndex = index
         startWidths = [...currentWidths]
         
         // Visual feedback
-        handleBar.style.background = theme.primary
-        handleBar.style.width = '4px'
+        const { handle, bar } = handles.get(index)
+        bar.style.background = theme.primary
+        bar.style.width = '4px'
         handle.style.background = `${theme.primary}25`
         
         // Dim indicators
-        const indicators = handleContainer.querySelectorAll('.column-indicator')
-        indicators.forEach(indicator => {
+        columns.forEach(({ indicator, label }) => {
             indicator.style.background = 'rgba(100, 100, 100, 0.03)'
-            const label = indicator.querySelector('div')
-            if (label) label.style.opacity = '0.3'
+            label.style.opacity = '0.3'
         })
+        tooltip.style.opacity = '0'
         
-        document.addEventListener('mousemove', handleResize)
-        document.addEventListener('mouseup', stopResize)
+        // No transitions while dragging, see the .dragging rules in index.html
+        handleContainer.classList.add('dragging')
         
         // Prevent text selection
         document.body.style.userSelect = 'none'
@@ -311,13 +633,21 @@ function onRender(event) {
         e.preventDefault()
     }
     
+    // Pointer events can fire several times per frame; only the latest
+    // position is applied, once per animation frame
     function handleResize(e) {
+        if (!isResizing || e.pointerId !== dragPointerId) return
+        dragClientX = e.clientX
+        if (!dragFrame) dragFrame = requestAnimationFrame(applyDrag)
+    }
+    
+    function applyDrag() {
+        dragFrame = 0
         if (!isResizing) return
         
-        const deltaX = e.clientX - startX
-        const containerWidth = handleContainer.offsetWidth
+        const deltaX = dragClientX - startX
         const totalGapWidth = (currentWidths.length - 1) * gapPixels
-        const availableWidth = containerWidth - totalGapWidth
+        const availableWidth = dragWidth - totalGapWidth
         const totalCurrentWidth = currentWidths.reduce((sum, w) => sum + w, 0)
         
         // Calculate change in ratio
@@ -346,92 +676,309 @@ function onRender(event) {
         currentWidths[leftIndex] = newLeftWidth
         currentWidths[rightIndex] = newRightWidth
         
-        // Update layout immediately
+        // Let the browser move the existing nodes to the new positions
         updateLayout()
+        scheduleLive()
     }
     
     function stopResize(e) {
-        if (!isResizing) return
+        if (!isResizing || e.pointerId !== dragPointerId) return
+        
+        // Apply the last position if its frame hasn't run yet
+        if (dragFrame) {
+            cancelAnimationFrame(dragFrame)
+            applyDrag()
+        }
         
         isResizing = false
-        document.removeEventListener('mousemove', handleResize)
-        document.removeEventListener('mouseup', stopResize)
+        dragPointerId = null
+        dragInProgress = false
+        onRerunRendered = null
+        clearTimeout(liveTimer)
+        liveTimer = null
+        livePending = false
+        handleContainer.classList.remove('dragging')
+        // Recycle the dragged handle's node if it ended up out of view
+        if (virtual) renderVisible()
         
         // Reset styles
         document.body.style.userSelect = ''
         document.body.style.cursor = ''
         
-        // Reset handle visuals
-        const handles = handleContainer.querySelectorAll('.resize-handle')
-        handles.forEach(handle => {
-            const handleBar = handle.querySelector('div')
-            if (handleBar) {
-                handleBar.style.background = `${theme.text}40`
-                handleBar.style.width = '2px'
-            }
-            handle.style.background = 'transparent'
-        })
-        
-        // Reset indicators
-        const indicators = handleContainer.querySelectorAll('.column-indicator')
-        indicators.forEach((indicator, index) => {
-            indicator.style.background = currentHidden[index] ? 
-                'rgba(255, 107, 107, 0.1)' : 
-                (border ? 'rgba(230, 234, 241, 0.1)' : 'rgba(100, 100, 100, 0.05)')
-            const label = indicator.querySelector('div')
-            if (label) label.style.opacity = currentHidden[index] ? '0.8' : '0.7'
-        })
+        // Reset handle and indicator visuals
+        handles.forEach((_, index) => updateHandle(index, false))
+        columns.forEach((_, index) => updateColumn(index, false))
         
-        // Send updated widths back to Streamlit
-        Streamlit.setComponentValue({
-            widths: currentWidths,
-            hidden: currentHidden,
-            action: "resize"
-        })
+        // Send updated widths back to Streamlit. This final value is always
+        // sent, even in live mode, so the last drag position is never lost.
+        rerunInFlightSince = Date.now()
+        send("resize", measure())
     }
     
-    container.appendChild(handleContainer)
+    parent.appendChild(handleContainer)
     
     // Initial layout
+    if (virtual) {
+        viewportWidth = handleContainer.clientWidth
+        handleContainer.addEventListener('scroll', () => {
+            if (!scrollFrame) scrollFrame = requestAnimationFrame(renderVisible)
+        }, { passive: true })
+    }
     updateLayout()
     
-    // Update layout on resize
-    const resizeObserver = new ResizeObserver(() => {
-        updateLayout()
-    })
-    resizeObserver.observe(handleContainer)
+    // Preset menu, over the top right corner of the strip
+    let menu = null
+    if (config.presets && config.presets.length) {
+        menu = document.createElement("select")
+        menu.className = "preset-menu"
+        menu.title = "Layout preset"
+        menu.style.cssText = `
+            position: absolute;
+            top: 10px;
+            right: 10px;
+            z-index: 1002;
+            font-size: 10px;
+            color: ${theme.text};
+            background: ${theme.background};
+            border: 1px solid ${theme.text}30;
+            border-radius: 4px;
+            padding: 0 2px;
+        `
+        config.presets.forEach(name => {
+            const option = document.createElement("option")
+            option.value = name
+            option.textContent = name
+            menu.appendChild(option)
+        })
+        menu.value = config.preset
+        menu.addEventListener('change', () => {
+            send("preset", measure(), { preset: menu.value })
+        })
+        parent.style.position = "relative"
+        parent.appendChild(menu)
+    }
     
-    // Set frame height
-    Streamlit.setFrameHeight(60)
+    // The grid follows resizes by itself; only a virtual strip's geometry
+    // and the pixel geometry reported to Python need watching, the latter
+    // only when it was asked for
+    let resizeObserver = null
+    if (virtual || config.reportPixels) {
+        resizeObserver = new ResizeObserver((entries) => {
+            if (virtual) {
+                viewportWidth = entries[entries.length - 1].contentRect.width
+                updateLayout()
+            }
+            if (config.reportPixels) {
+                // Wait for the size to settle before reporting it to Python
+                clearTimeout(measureTimer)
+                measureTimer = setTimeout(reportGeometry, 250)
+            }
+        })
+        resizeObserver.observe(handleContainer)
+    }
     
-    // Add styles
-    const style = document.createElement('style')
-    style.textContent = `
-        body {
-            margin: 0;
-            padding: 0;
-            overflow: hidden;
+    return function teardown() {
+        if (resizeObserver) resizeObserver.disconnect()
+        clearTimeout(measureTimer)
+        clearTimeout(liveTimer)
+        clearTimeout(clickTimer)
+        if (dragFrame) cancelAnimationFrame(dragFrame)
+        if (scrollFrame) cancelAnimationFrame(scrollFrame)
+        if (isResizing) {
+            dragInProgress = false
+            onRerunRendered = null
+            document.body.style.userSelect = ''
+            document.body.style.cursor = ''
         }
-        
-        #root {
-            width: 100%;
-            padding: 8px;
-            box-sizing: border-box;
+        handleContainer.remove()
+        if (menu) menu.remove()
+    }
+}
+
+// Palette used when Streamlit doesn't send a theme
+const DEFAULT_PALETTE = {
+    primary: '#ff6b6b',
+    background: '#ffffff',
+    secondary: '#f0f2f6',
+    text: '#262730',
+    border: '#e6eaf1'
+}
+
+let palette = DEFAULT_PALETTE
+let paletteKey = null
+
+/**
+ * Returns the strip colors for the theme Streamlit sends with every render
+ * event. The palette is only rebuilt when the theme colors change.
+ */
+function resolvePalette(theme) {
+    if (!theme) return DEFAULT_PALETTE
+    const key = `${theme.primaryColor}|${theme.backgroundColor}|${theme.secondaryBackgroundColor}|${theme.textColor}`
+    if (key !== paletteKey) {
+        paletteKey = key
+        palette = {
+            primary: theme.primaryColor || DEFAULT_PALETTE.primary,
+            background: theme.backgroundColor || DEFAULT_PALETTE.background,
+            secondary: theme.secondaryBackgroundColor || DEFAULT_PALETTE.secondary,
+            text: theme.textColor || DEFAULT_PALETTE.text,
+            border: DEFAULT_PALETTE.border
         }
-        
+    }
+    return palette
+}
+
+// Teardown functions of the strips of the current render
+let mountedStrips = []
+
+// Fingerprint of the config and palette the current strips were built from,
+// and the frame height last sent to Streamlit
+let renderedFingerprint = null
+let renderedPalette = null
+let frameHeight = 0
+
+function mountStrip(parent, config, theme, commit) {
+    mountedStrips.push(renderStrip(parent, config, theme, (...args) => {
+        // The strip no longer shows the config it was built from, so the
+        // next render rebuilds it even if Python sends the same config back
+        // (e.g. when it drops an outdated value)
+        if (args[2] !== "measure") renderedFingerprint = null
+        commit(...args)
+    }))
+}
+
+function unmountStrips() {
+    mountedStrips.forEach(teardown => teardown())
+    mountedStrips = []
+    renderedFingerprint = null
+}
+
+// The one style element of the component, holding the rules that depend on
+// the theme. The static base styles are part of index.html.
+const styleElement = document.createElement('style')
+styleElement.id = 'adjustable-columns-styles'
+document.head.appendChild(styleElement)
+
+function updateStyles(theme) {
+    const css = `
         .resize-handle:hover {
             background-color: ${theme.primary}15 !important;
         }
-        
-        .column-indicator {
-            transition: background 0.15s ease, opacity 0.15s ease;
+    `
+    if (styleElement.textContent !== css) styleElement.textContent = css
+}
+
+/**
+ * Renders one strip per column set. A plain config describes a single set
+ * of columns; a config with `layouts` (from adjustable_layouts) describes
+ * several sets served by this one component instance, and a config with
+ * `grid` (from adjustable_grid) gets a column strip and a row strip.
+ */
+function onRender(event) {
+    const data = event.detail
+    const config = data.args.config
+    
+    // A rerun we requested has rendered
+    rerunInFlightSince = 0
+    if (dragInProgress) {
+        // Don't tear the strip down under the user's pointer; the value sent
+        // when the drag ends triggers a render with the final state
+        if (onRerunRendered) onRerunRendered()
+        return
+    }
+    
+    // Nothing to do on reruns that didn't change the config or the theme
+    const theme = resolvePalette(data.theme)
+    if (config.fingerprint && config.fingerprint === renderedFingerprint && theme === renderedPalette) {
+        return
+    }
+    
+    // Replace the strips of the previous render
+    unmountStrips()
+    const container = document.getElementById("root")
+    
+    updateStyles(theme)
+    
+    if (config.grid) {
+        // A grid is driven by a strip for its columns and a strip for its rows
+        const grid = config.grid
+        const gridValue = {
+            widths: [...grid.widths],
+            heights: [...grid.heights],
+            hidden: [...grid.hidden]
         }
-        
-        .resize-handle {
-            transition: background 0.15s ease;
+        const commitGrid = (action) => {
+            Streamlit.setComponentValue({ ...gridValue, action: action })
         }
-    `
-    document.head.appendChild(style)
+        
+        mountStrip(container, {
+            widths: grid.widths,
+            labels: grid.colLabels,
+            hidden: grid.hidden,
+            gap: grid.gap,
+            border: grid.border
+        }, theme, (widths, hidden, action) => {
+            gridValue.widths = [...widths]
+            gridValue.hidden = [...hidden]
+            commitGrid(action)
+        })
+        mountStrip(container, {
+            widths: grid.heights,
+            labels: grid.rowLabels,
+            gap: grid.gap,
+            border: grid.border,
+            hidable: false
+        }, theme, (heights, hidden, action) => {
+            gridValue.heights = [...heights]
+            commitGrid(action)
+        })
+    } else if (config.layouts) {
+        // Current state of every layout, reported back together
+        const layoutValues = config.layouts.map(layout => ({
+            widths: [...layout.widths],
+            hidden: [...(layout.hidden || layout.widths.map(() => false))]
+        }))
+        
+        config.layouts.forEach((layout, index) => {
+            mountStrip(container, layout, theme, (widths, hidden, action) => {
+                layoutValues[index] = { widths: [...widths], hidden: [...hidden] }
+                Streamlit.setComponentValue({
+                    layouts: layoutValues,
+                    index: index,
+                    action: action
+                })
+            })
+        })
+    } else {
+        mountStrip(container, config, theme, (widths, hidden, action, geometry, extra) => {
+            // Echo the version so Python can drop values sent before it
+            // changed the layout itself (e.g. applied a preset). Virtual
+            // strips answer in the compact encoding they were sent.
+            const value = {
+                widths: widths,
+                hidden: hidden,
+                action: action,
+                version: config.version,
+                ...geometry,
+                ...extra
+            }
+            if (config.virtual) {
+                value.widths = encodeWidths(widths)
+                value.hidden = encodeHidden(hidden)
+                if (value.pixelWidths) value.pixelWidths = encodeWidths(value.pixelWidths)
+            }
+            Streamlit.setComponentValue(value)
+        })
+    }
+    
+    renderedFingerprint = config.fingerprint
+    renderedPalette = theme
+    
+    // Set frame height, only messaging Streamlit when it changed
+    const stripCount = config.grid ? 2 : (config.layouts ? config.layouts.length : 1)
+    if (STRIP_HEIGHT * stripCount !== frameHeight) {
+        frameHeight = STRIP_HEIGHT * stripCount
+        Streamlit.setFrameHeight(frameHeight)
+    }
 }
 
 // Attach our function to the onRender event
@@ -0,0 +1,53 @@
+/**
+ * The part of the Streamlit component protocol this component uses, in
+ * place of streamlit-component-lib. That library pulls React and Apache
+ * Arrow into the bundle for dataframe and React component support, none of
+ * which a strip of resize handles needs.
+ *
+ * Messages to Streamlit are posted to the parent window as
+ * `{isStreamlitMessage: true, type, ...data}`. Streamlit answers with
+ * "streamlit:render" messages carrying the component args and theme, which
+ * are dispatched to `Streamlit.events` like the library does.
+ */
+
+// Version of the component protocol, sent when the component is ready
+const API_VERSION = 1
+
+const events = new EventTarget()
+let registered = false
+
+function send(type, data) {
+    window.parent.postMessage({ isStreamlitMessage: true, type: type, ...data }, "*")
+}
+
+function onMessage(event) {
+    const data = event.data
+    if (!data || data.type !== "streamlit:render") return
+    events.dispatchEvent(new CustomEvent("streamlit:render", {
+        detail: {
+            args: data.args || {},
+            disabled: Boolean(data.disabled),
+            theme: data.theme
+        }
+    }))
+}
+
+export const Streamlit = {
+    events: events,
+
+    setComponentReady() {
+        if (!registered) {
+            window.addEventListener("message", onMessage)
+            registered = true
+        }
+        send("streamlit:componentReady", { apiVersion: API_VERSION })
+    },
+
+    setFrameHeight(height) {
+        send("streamlit:setFrameHeight", { height: height })
+    },
+
+    setComponentValue(value) {
+        send("streamlit:setComponentValue", { value: value, dataType: "json" })
+    }
+}
@@ -1,36 +1,103 @@
 const HtmlWebpackPlugin = require('html-webpack-plugin');
 const path = require('path');
 
-module.exports = {
+// Writes asset-manifest.json, mapping the logical asset names to the
+// emitted (content hashed) files. The Python package checks the build
+// against it.
+class AssetManifestPlugin {
+  apply(compiler) {
+    const { Compilation, sources } = compiler.webpack;
+    compiler.hooks.thisCompilation.tap('AssetManifestPlugin', (compilation) => {
+      compilation.hooks.processAssets.tap(
+        { name: 'AssetManifestPlugin', stage: Compilation.PROCESS_ASSETS_STAGE_REPORT },
+        () => {
+          const files = {};
+          for (const [name, entrypoint] of compilation.entrypoints) {
+            for (const file of entrypoint.getFiles()) {
+              // Inlined files are no longer part of the build
+              if (compilation.getAsset(file)) {
+                files[`${name}${path.extname(file)}`] = file;
+              }
+            }
+          }
+          if (compilation.getAsset('index.html')) {
+            files['index.html'] = 'index.html';
+          }
+          compilation.emitAsset(
+            'asset-manifest.json',
+            new sources.RawSource(JSON.stringify({ files: files }, null, 2))
+          );
+        }
+      );
+    });
+  }
+}
+
+// Inlines the bundle into index.html and drops the separate file, so each
+// component iframe is served by a single request (see `npm run build:inline`)
+class InlineScriptPlugin {
+  apply(compiler) {
+    const { Compilation } = compiler.webpack;
+    compiler.hooks.thisCompilation.tap('InlineScriptPlugin', (compilation) => {
+      const inlined = new Set();
+      HtmlWebpackPlugin.getHooks(compilation).alterAssetTagGroups.tap(
+        'InlineScriptPlugin',
+        (data) => {
+          const inline = (tag) => {
+            const src = tag.tagName === 'script' && tag.attributes.src;
+            const asset = src && compilation.getAsset(src.slice(data.publicPath.length));
+            if (!asset) return tag;
+            inlined.add(asset.name);
+            return {
+              tagName: 'script',
+              voidTag: false,
+              innerHTML: asset.source.source().toString(),
+              attributes: {},
+              meta: tag.meta,
+            };
+          };
+          data.headTags = data.headTags.map(inline);
+          data.bodyTags = data.bodyTags.map(inline);
+          return data;
+        }
+      );
+      compilation.hooks.processAssets.tap(
+        { name: 'InlineScriptPlugin', stage: Compilation.PROCESS_ASSETS_STAGE_SUMMARIZE },
+        () => inlined.forEach((name) => compilation.deleteAsset(name))
+      );
+    });
+  }
+}
+
+module.exports = (env, argv) => ({
   entry: './src/main.js',
   output: {
     path: path.resolve(__dirname, 'build'),
-    filename: 'main.js',
+    // Hashed names let browsers cache the bundle until its content changes,
+    // and a deploy can never pair a new index.html with an old bundle
+    filename: argv.mode === 'production' && !env.inline ? 'main.[contenthash].js' : 'main.js',
+    clean: true,
   },
-  module: {
-    rules: [
-      {
-        test: /\.js$/,
-        exclude: /node_modules/,
-        use: {
-          loader: 'babel-loader',
-          options: {
-            presets: ['@babel/preset-env']
-          }
-        }
-      }
-    ]
+  // Shipped as modern JavaScript, like Streamlit's own frontend: no
+  // transpiling or polyfills, only minification
+  target: ['web', 'es2020'],
+  // Every component iframe downloads and parses the bundle, fail the build
+  // if the production build grows past this budget (see benchmarks/bench_bundle.py)
+  performance: {
+    hints: argv.mode === 'production' ? 'error' : false,
+    maxAssetSize: 24 * 1024,
+    maxEntrypointSize: 24 * 1024,
   },
   plugins: [
+    // Generates index.html from the template, with the bundle's script tag.
+    // An inlined script can't be deferred, so it goes at the end of the body.
     new HtmlWebpackPlugin({
-      template: 'public/index.html', // Use your existing file
-    })
+      template: 'public/index.html',
+      inject: env.inline ? 'body' : 'head',
+    }),
+    ...(env.inline ? [new InlineScriptPlugin()] : []),
+    new AssetManifestPlugin(),
   ],
-  resolve: {
-    fallback: {
-      "util": false
-    }
-  },
   devServer: {
     static: {
       directory: path.join(__dirname, 'public'),
@@ -41,4 +108,4 @@ module.exports = {
     },
     allowedHosts: "all"
   }
-};
+});
@@ -0,0 +1,261 @@
+"""Persistent storage for adjustable column layouts.
+
+Widths and hidden flags normally live only in ``st.session_state``, so every
+new session starts from ``spec``. A :class:`LayoutStore` keeps them across
+sessions, keyed by layout key and a user or profile id::
+
+    from streamlit_adjustable_columns import (
+        LayoutStore,
+        SQLiteBackend,
+        set_layout_store,
+    )
+
+    store = LayoutStore(SQLiteBackend("layouts.db"))
+    set_layout_store(store, profile=lambda: st.user.email)
+
+Reads go through an in-memory LRU cache. Writes update the cache immediately
+and are coalesced and flushed to the backend by a background thread, so a
+drag never waits for disk I/O.
+"""
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LayoutBackend:
+    """Base class for layout storage backends.
+
+    Backends store one JSON-serializable state dict per ``(profile, layout)``
+    pair. They are only called from the store's cache misses and its flush
+    thread, never while a script run waits on a write.
+    """
+
+    def load(self, profile, layout):
+        """Return the stored state of ``layout`` for ``profile``, or None."""
+        raise NotImplementedError
+
+    def save_many(self, items):
+        """Store ``{(profile, layout): state}`` for every entry of ``items``."""
+        raise NotImplementedError
+
+    def close(self):
+        """Release any resources held by the backend."""
+
+
+class MemoryBackend(LayoutBackend):
+    """Backend keeping layouts in process memory. Useful for tests."""
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def load(self, profile, layout):
+        with self._lock:
+            return self._data.get((profile, layout))
+
+    def save_many(self, items):
+        with self._lock:
+            self._data.update(items)
+
+
+class FileBackend(LayoutBackend):
+    """Backend storing all layouts in a single JSON file.
+
+    The file is read once and then kept in memory; every flush rewrites it
+    atomically.
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        self._data = None
+        self._lock = threading.Lock()
+
+    def _read(self):
+        if self._data is None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._data = json.load(f)
+            except FileNotFoundError:
+                self._data = {}
+        return self._data
+
+    def load(self, profile, layout):
+        with self._lock:
+            return self._read().get(profile, {}).get(layout)
+
+    def save_many(self, items):
+        with self._lock:
+            data = self._read()
+            for (profile, layout), state in items.items():
+                data.setdefault(profile, {})[layout] = state
+
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+
+class SQLiteBackend(LayoutBackend):
+    """Backend storing layouts in an SQLite database."""
+
+    def __init__(self, path):
+        # Imported here so that importing the package doesn't load sqlite3
+        import sqlite3
+
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS adjustable_layouts ("
+                " profile TEXT NOT NULL,"
+                " layout TEXT NOT NULL,"
+                " state TEXT NOT NULL,"
+                " PRIMARY KEY (profile, layout))"
+            )
+
+    def load(self, profile, layout):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state FROM adjustable_layouts"
+                " WHERE profile = ? AND layout = ?",
+                (profile, layout),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_many(self, items):
+        rows = [
+            (profile, layout, json.dumps(state))
+            for (profile, layout), state in items.items()
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO adjustable_layouts (profile, layout, state)"
+                " VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class LayoutStore:
+    """LRU-cached, write-behind front for a :class:`LayoutBackend`.
+
+    Parameters
+    ----------
+    backend : LayoutBackend
+        Where layouts are persisted.
+    cache_size : int, default 1024
+        Maximum number of layouts kept in the in-memory cache.
+    flush_interval : float, default 1.0
+        Seconds between two flushes of pending writes. All writes to the
+        same layout within one interval are coalesced into one.
+    """
+
+    def __init__(self, backend, *, cache_size=1024, flush_interval=1.0):
+        if cache_size <= 0:
+            raise ValueError("cache_size must be a positive number")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be a positive number of seconds")
+
+        self.backend = backend
+        self.cache_size = cache_size
+        self.flush_interval = flush_interval
+
+        self._cache = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._closed = False
+
+    def get(self, profile, layout):
+        """Return the state of ``layout`` for ``profile``, or None."""
+        key = (profile, layout)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        state = self.backend.load(profile, layout)
+        with self._lock:
+            # A write may have landed while we were reading the backend
+            if key in self._cache:
+                return self._cache[key]
+            self._remember(key, state)
+        return state
+
+    def put(self, profile, layout, state):
+        """Store the state of ``layout`` for ``profile`` without blocking on I/O."""
+        key = (profile, layout)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("LayoutStore is closed")
+            self._remember(key, state)
+            self._pending[key] = state
+            if self._thread is None:
+                self._start_flush_thread()
+
+    def flush(self):
+        """Write all pending changes to the backend now."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        try:
+            self.backend.save_many(pending)
+        except Exception:
+            # Put the writes back so they're retried, unless newer ones arrived
+            with self._lock:
+                self._pending = {**pending, **self._pending}
+            raise
+
+    def close(self):
+        """Flush pending changes, stop the flush thread and close the backend."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        self._wakeup.set()
+        if thread is not None:
+            thread.join()
+        self.flush()
+        self.backend.close()
+
+    def _remember(self, key, state):
+        # Must be called with self._lock held
+        self._cache[key] = state
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _start_flush_thread(self):
+        # Must be called with self._lock held
+        self._thread = threading.Thread(
+            target=self._flush_loop, name="adjustable-columns-store", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _flush_loop(self):
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                _LOGGER.exception("Failed to persist adjustable column layouts")
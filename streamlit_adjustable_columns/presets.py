@@ -0,0 +1,113 @@
+"""Named layout presets shared by all sessions.
+
+A preset file maps preset names to the widths (and optionally hidden flags)
+of each layout, by layout key. JSON and TOML are supported::
+
+    # layouts.toml
+    [analyst.main]
+    widths = [3, 1]
+
+    [ops.main]
+    widths = [1, 1]
+    hidden = [false, true]
+
+The file is parsed once per process. The resulting :class:`PresetRegistry`
+is immutable, so a single instance is safely shared across sessions.
+"""
+
+import functools
+import json
+import os
+from collections import namedtuple
+from types import MappingProxyType
+
+
+def _read_toml(path):
+    # Imported here as only TOML preset files need it
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11, use the toml package Streamlit depends on
+        import toml
+
+        return toml.load(path)
+
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+LayoutPreset = namedtuple("LayoutPreset", ["widths", "hidden"])
+LayoutPreset.__doc__ = """Widths and hidden flags of one layout in a preset."""
+
+
+class PresetRegistry:
+    """An immutable collection of named layout presets.
+
+    Parameters
+    ----------
+    presets : Mapping
+        ``{preset_name: {layout_key: {"widths": [...], "hidden": [...]}}}``.
+        ``hidden`` is optional.
+    """
+
+    __slots__ = ("_presets",)
+
+    def __init__(self, presets):
+        parsed = {}
+        for name, layouts in presets.items():
+            parsed[name] = MappingProxyType(
+                {
+                    layout: self._parse_layout(name, layout, state)
+                    for layout, state in layouts.items()
+                }
+            )
+        self._presets = MappingProxyType(parsed)
+
+    @staticmethod
+    def _parse_layout(name, layout, state):
+        widths = tuple(state.get("widths") or ())
+        if not widths or any(w <= 0 for w in widths):
+            raise ValueError(
+                f"Preset '{name}' must give positive widths for layout '{layout}'"
+            )
+        hidden = state.get("hidden")
+        if hidden is not None:
+            if len(hidden) != len(widths) or not all(
+                isinstance(x, bool) for x in hidden
+            ):
+                raise ValueError(
+                    f"Preset '{name}' must give one boolean hidden flag per "
+                    f"column for layout '{layout}'"
+                )
+            hidden = tuple(hidden)
+        return LayoutPreset(widths, hidden)
+
+    @property
+    def names(self):
+        """The preset names, in file order."""
+        return tuple(self._presets)
+
+    def __contains__(self, name):
+        return name in self._presets
+
+    def get(self, name, layout):
+        """Return the LayoutPreset of ``layout`` in preset ``name``, or None."""
+        return self._presets[name].get(layout)
+
+
+def load_presets(path):
+    """Load a JSON or TOML preset file.
+
+    Each path is only read and parsed once per process; later calls return
+    the same :class:`PresetRegistry`.
+    """
+    return _load_presets(os.path.abspath(os.fspath(path)))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_presets(path):
+    if path.endswith(".toml"):
+        data = _read_toml(path)
+    else:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    return PresetRegistry(data)
@@ -0,0 +1,144 @@
+"""Compact per-layout state kept in ``st.session_state``.
+
+Each layout stores a single :class:`LayoutState` under one session key.
+Widths are kept as a tuple rounded to a fixed precision, hidden flags as a
+bitmask, and label tuples are interned so that every session rendering the
+same labels shares one tuple.
+
+Layouts with many columns exchange widths and hidden flags with the frontend
+in a compact encoding, see :func:`encode_widths` and :func:`encode_hidden`.
+"""
+
+import base64
+import struct
+
+# Number of decimals kept for width ratios
+WIDTH_DIGITS = 4
+
+# Interned label tuples, shared by all sessions. Bounded so that apps
+# generating labels dynamically can't grow it forever.
+_LABELS = {}
+_MAX_INTERNED_LABELS = 4096
+
+
+def intern_labels(labels):
+    """Return a tuple equal to ``labels``, shared with other sessions if possible."""
+    labels = tuple(labels)
+    interned = _LABELS.get(labels)
+    if interned is not None:
+        return interned
+    if len(_LABELS) >= _MAX_INTERNED_LABELS:
+        return labels
+    return _LABELS.setdefault(labels, labels)
+
+
+def pack_widths(widths):
+    """Return ``widths`` as a tuple rounded to WIDTH_DIGITS decimals."""
+    return tuple(round(width, WIDTH_DIGITS) for width in widths)
+
+
+def pack_hidden(hidden):
+    """Return the bitmask of a list of hidden flags (bit i set: column i hidden)."""
+    mask = 0
+    for index, is_hidden in enumerate(hidden):
+        if is_hidden:
+            mask |= 1 << index
+    return mask
+
+
+def unpack_hidden(mask, count):
+    """Return the list of ``count`` hidden flags encoded in ``mask``."""
+    return [bool(mask >> index & 1) for index in range(count)]
+
+
+def encode_widths(widths):
+    """Return ``widths`` as base64 of little-endian float32 values."""
+    data = struct.pack(f"<{len(widths)}f", *widths)
+    return base64.b64encode(data).decode("ascii")
+
+
+def decode_widths(data):
+    """Return the tuple of widths encoded by :func:`encode_widths`."""
+    raw = base64.b64decode(data)
+    return struct.unpack(f"<{len(raw) // 4}f", raw)
+
+
+def encode_hidden(mask, count):
+    """Return the bitmask of ``count`` hidden flags as base64 bytes."""
+    data = mask.to_bytes((count + 7) // 8, "little")
+    return base64.b64encode(data).decode("ascii")
+
+
+def decode_hidden(data):
+    """Return the bitmask encoded by :func:`encode_hidden`."""
+    return int.from_bytes(base64.b64decode(data), "little")
+
+
+class LayoutState:
+    """The state of one set of adjustable columns in a session.
+
+    Parameters
+    ----------
+    widths : Iterable of numbers
+        The width ratios of the columns.
+    hidden : Iterable of bool
+        Which columns are hidden.
+    labels : Iterable of str, optional
+        The labels shown in the resize handles.
+    """
+
+    __slots__ = (
+        "widths",
+        "hidden_mask",
+        "labels",
+        "version",
+        "preset",
+        "container_width",
+        "pixel_widths",
+        "device_pixel_ratio",
+    )
+
+    def __init__(self, widths, hidden, labels=()):
+        self.widths = pack_widths(widths)
+        self.hidden_mask = pack_hidden(hidden)
+        self.labels = intern_labels(labels)
+        # Bumped when Python changes the layout, e.g. by applying a preset
+        self.version = 0
+        # Name of the preset last applied to the layout
+        self.preset = None
+        # Pixel geometry reported by the frontend
+        self.container_width = None
+        self.pixel_widths = None
+        self.device_pixel_ratio = None
+
+    @property
+    def count(self):
+        """The number of columns."""
+        return len(self.widths)
+
+    @property
+    def hidden(self):
+        """The hidden flags as a list of bool."""
+        return unpack_hidden(self.hidden_mask, len(self.widths))
+
+    def update(self, widths=None, hidden=None):
+        """Set new widths and/or hidden flags, returning whether anything changed."""
+        changed = False
+        if widths is not None:
+            widths = pack_widths(widths)
+            if widths != self.widths:
+                self.widths = widths
+                changed = True
+        if hidden is not None:
+            mask = pack_hidden(hidden)
+            if mask != self.hidden_mask:
+                self.hidden_mask = mask
+                changed = True
+        return changed
+
+    def to_dict(self):
+        """Return the widths and hidden flags as JSON-serializable lists."""
+        return {"widths": list(self.widths), "hidden": self.hidden}
+
+    def __repr__(self):
+        return f"LayoutState(widths={self.widths!r}, hidden={self.hidden!r})"
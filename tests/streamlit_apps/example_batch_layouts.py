@@ -0,0 +1,25 @@
+import streamlit as st
+
+from streamlit_adjustable_columns import adjustable_layouts
+
+st.subheader("Test Adjustable Layouts")
+
+top, bottom = adjustable_layouts(
+    [
+        {"spec": 3, "labels": ["Top A", "Top B", "Top C"]},
+        {"spec": [2, 1], "labels": ["Bottom A", "Bottom B"], "return_widths": True},
+    ],
+    key="batch_test",
+)
+
+st.write("First row")
+col1, col2, col3 = top.columns()
+col1.write("Row 1 column A")
+col2.write("Row 1 column B")
+col3.write("Row 1 column C")
+
+st.write("Second row")
+result = bottom.columns()
+left, right = result["columns"]
+left.write("Row 2 column A")
+right.write(f"Bottom widths: {[f'{w:.2f}' for w in result['widths']]}")
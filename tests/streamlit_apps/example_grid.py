@@ -0,0 +1,23 @@
+import streamlit as st
+
+from streamlit_adjustable_columns import adjustable_grid
+
+st.subheader("Test Adjustable Grid")
+
+result = adjustable_grid(
+    2,
+    [2, 1],
+    height=300,
+    row_labels=["Top", "Bottom"],
+    col_labels=["Main", "Side"],
+    return_widths=True,
+    key="grid_test",
+)
+
+cells = result["cells"]
+cells[0][0].write("Top main cell")
+cells[0][1].write("Top side cell")
+cells[1][0].write("Bottom main cell")
+cells[1][1].write("Bottom side cell")
+
+st.info(f"Grid heights: {[f'{h:.2f}' for h in result['heights']]}")
@@ -9,6 +9,7 @@ result = adjustable_columns(
     3,
     labels=["Col A", "Col B", "Col C"],
     return_widths=True,
+    report_pixels=True,
     key="widths_test",
 )
 
@@ -16,6 +17,7 @@ columns = result["columns"]
 widths = result["widths"]
 
 st.info(f"Current width ratios: {[f'{w:.2f}' for w in widths]}")
+st.write(f"Pixel widths: {result['pixel_widths']}")
 
 with columns[0]:
     st.write("Column A")
@@ -0,0 +1,11 @@
+import streamlit as st
+
+from streamlit_adjustable_columns import adjustable_columns
+
+st.subheader("Test Wide Adjustable Columns")
+
+# Enough columns for the virtualized handle strip
+result = adjustable_columns(200, return_widths=True, key="wide_test")
+
+widths = result["widths"]
+st.write(f"First widths: {[round(w, 2) for w in widths[:3]]}")
@@ -0,0 +1,60 @@
+import os
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import Page, expect
+
+from tests import ROOT_DIRECTORY
+from tests.e2e_utils import StreamlitRunner
+
+BATCH_EXAMPLE_FILE = os.path.join(
+    ROOT_DIRECTORY, "tests", "streamlit_apps", "example_batch_layouts.py"
+)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def streamlit_app():
+    with StreamlitRunner(Path(BATCH_EXAMPLE_FILE)) as runner:
+        yield runner
+
+
+@pytest.fixture(autouse=True, scope="function")
+def go_to_app(page: Page, streamlit_app: StreamlitRunner):
+    page.goto(streamlit_app.server_url)
+    # Wait for app to load
+    page.get_by_role("img", name="Running...").is_hidden()
+
+
+@pytest.mark.e2e
+def test_should_render_single_iframe_for_all_layouts(page: Page):
+    """Test that several layouts share one component iframe."""
+    expect(page.get_by_text("Test Adjustable Layouts")).to_be_visible()
+
+    iframes = page.locator(
+        'iframe[title="streamlit_adjustable_columns.streamlit_adjustable_columns"]'
+    )
+    expect(iframes.first).to_be_visible()
+    assert iframes.count() == 1
+
+
+@pytest.mark.e2e
+def test_should_render_handles_for_every_layout(page: Page):
+    """Test that the shared iframe shows the labels and handles of each layout."""
+    iframe_frame = page.frame_locator(
+        'iframe[title="streamlit_adjustable_columns.streamlit_adjustable_columns"]'
+    )
+    expect(iframe_frame.get_by_text("Top A")).to_be_visible()
+    expect(iframe_frame.get_by_text("Bottom B")).to_be_visible()
+
+    # 2 handles for the 3-column layout plus 1 for the 2-column layout
+    resize_handles = iframe_frame.locator(".resize-handle")
+    expect(resize_handles.first).to_be_visible()
+    assert resize_handles.count() == 3
+
+
+@pytest.mark.e2e
+def test_should_place_columns_where_requested(page: Page):
+    """Test that each layout's columns are created at the .columns() call."""
+    expect(page.get_by_text("Row 1 column A")).to_be_visible()
+    expect(page.get_by_text("Row 2 column A")).to_be_visible()
+    expect(page.locator("text=/Bottom widths:/")).to_be_visible()
@@ -0,0 +1,60 @@
+import os
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import Page, expect
+
+from tests import ROOT_DIRECTORY
+from tests.e2e_utils import StreamlitRunner
+
+GRID_EXAMPLE_FILE = os.path.join(
+    ROOT_DIRECTORY, "tests", "streamlit_apps", "example_grid.py"
+)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def streamlit_app():
+    with StreamlitRunner(Path(GRID_EXAMPLE_FILE)) as runner:
+        yield runner
+
+
+@pytest.fixture(autouse=True, scope="function")
+def go_to_app(page: Page, streamlit_app: StreamlitRunner):
+    page.goto(streamlit_app.server_url)
+    # Wait for app to load
+    page.get_by_role("img", name="Running...").is_hidden()
+
+
+@pytest.mark.e2e
+def test_should_render_grid_with_one_iframe(page: Page):
+    """Test that the whole grid is driven by a single component iframe."""
+    expect(page.get_by_text("Test Adjustable Grid")).to_be_visible()
+
+    iframes = page.locator(
+        'iframe[title="streamlit_adjustable_columns.streamlit_adjustable_columns"]'
+    )
+    expect(iframes.first).to_be_visible()
+    assert iframes.count() == 1
+
+
+@pytest.mark.e2e
+def test_should_render_row_and_column_handles(page: Page):
+    """Test that the grid shows a column strip and a row strip."""
+    iframe_frame = page.frame_locator(
+        'iframe[title="streamlit_adjustable_columns.streamlit_adjustable_columns"]'
+    )
+    expect(iframe_frame.get_by_text("Main")).to_be_visible()
+    expect(iframe_frame.get_by_text("Bottom")).to_be_visible()
+
+    # One handle between the two columns and one between the two rows
+    resize_handles = iframe_frame.locator(".resize-handle")
+    expect(resize_handles.first).to_be_visible()
+    assert resize_handles.count() == 2
+
+
+@pytest.mark.e2e
+def test_should_render_all_cells(page: Page):
+    """Test that every cell of the grid is rendered."""
+    expect(page.get_by_text("Top main cell")).to_be_visible()
+    expect(page.get_by_text("Bottom side cell")).to_be_visible()
+    expect(page.locator("text=/Grid heights:/")).to_be_visible()
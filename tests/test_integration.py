@@ -56,7 +56,7 @@ class TestAdjustableColumnsIntegration:
                     )
 
                     # State should be updated (note the correct session key format)
-                    assert "adjustable_columns_widths_persist_test" in session_state
+                    assert "adjustable_columns_state_persist_test" in session_state
 
                     # Second call should use persisted state
                     result2 = adjustable_columns(
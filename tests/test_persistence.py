@@ -0,0 +1,197 @@
+"""Unit tests for the persistent layout store."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import streamlit_adjustable_columns
+from streamlit_adjustable_columns import (
+    FileBackend,
+    LayoutStore,
+    MemoryBackend,
+    PresetRegistry,
+    SQLiteBackend,
+    adjustable_columns,
+    set_layout_store,
+    set_presets,
+)
+
+
+@pytest.fixture
+def store():
+    """A layout store installed for the duration of a test."""
+    layout_store = LayoutStore(MemoryBackend(), flush_interval=60)
+    set_layout_store(layout_store, profile="alice")
+    yield layout_store
+    set_layout_store(None)
+    layout_store.close()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "backend_class, filename",
+    [(FileBackend, "layouts.json"), (SQLiteBackend, "layouts.db")],
+)
+def test_backends_round_trip(tmp_path, backend_class, filename):
+    """Test that the file and SQLite backends store and load layouts."""
+    backend = backend_class(tmp_path / filename)
+    backend.save_many(
+        {
+            ("alice", "main"): {"widths": [2, 1], "hidden": [False, False]},
+            ("bob", "main"): {"widths": [1, 3], "hidden": [True, False]},
+        }
+    )
+    backend.close()
+
+    backend = backend_class(tmp_path / filename)
+    assert backend.load("alice", "main") == {"widths": [2, 1], "hidden": [False, False]}
+    assert backend.load("bob", "main")["widths"] == [1, 3]
+    assert backend.load("alice", "other") is None
+    backend.close()
+
+
+@pytest.mark.unit
+def test_store_coalesces_writes_until_flush():
+    """Test that writes are cached immediately and flushed in one batch."""
+    backend = MagicMock()
+    backend.load.return_value = None
+    layout_store = LayoutStore(backend, flush_interval=60)
+
+    try:
+        layout_store.put("alice", "main", {"widths": [1, 1]})
+        layout_store.put("alice", "main", {"widths": [2, 1]})
+        assert layout_store.get("alice", "main") == {"widths": [2, 1]}
+        backend.save_many.assert_not_called()
+
+        layout_store.flush()
+        backend.save_many.assert_called_once_with(
+            {("alice", "main"): {"widths": [2, 1]}}
+        )
+    finally:
+        layout_store.close()
+
+
+@pytest.mark.unit
+def test_store_lru_cache():
+    """Test that the front cache keeps at most cache_size layouts."""
+    backend = MemoryBackend()
+    backend.save_many({("p", name): {"widths": [1]} for name in "abc"})
+    backend.load = MagicMock(wraps=backend.load)
+    layout_store = LayoutStore(backend, cache_size=2)
+
+    layout_store.get("p", "a")
+    layout_store.get("p", "b")
+    layout_store.get("p", "a")  # Cached
+    layout_store.get("p", "c")  # Evicts "b"
+    layout_store.get("p", "b")
+
+    loaded = [call.args[1] for call in backend.load.call_args_list]
+    assert loaded == ["a", "b", "c", "b"]
+    layout_store.close()
+
+
+@pytest.mark.unit
+def test_adjustable_columns_uses_store(store):
+    """Test that new sessions start from, and changes go to, the store."""
+    store.put("alice", "persisted", {"widths": [3, 1], "hidden": [False, True]})
+
+    with (
+        patch("streamlit_adjustable_columns._component_func") as mock_component,
+        patch("streamlit_adjustable_columns.st.session_state", {}),
+        patch("streamlit_adjustable_columns.st.columns") as mock_columns,
+        patch("streamlit_adjustable_columns.st.markdown"),
+        patch("streamlit_adjustable_columns.st.rerun"),
+    ):
+        mock_columns.return_value = [MagicMock(), MagicMock()]
+        mock_component.return_value = None
+
+        result = adjustable_columns(2, return_widths=True, key="persisted")
+        assert result["widths"] == [3, 1]
+        assert result["hidden"] == [False, True]
+
+        mock_component.return_value = {"widths": [1, 1], "hidden": [False, False]}
+        adjustable_columns(2, key="persisted")
+
+    assert store.get("alice", "persisted") == {
+        "widths": [1, 1],
+        "hidden": [False, False],
+    }
+    assert streamlit_adjustable_columns._current_profile() == "alice"
+
+
+@pytest.mark.unit
+def test_adjustable_grid_uses_store(store):
+    """Test that grids start from the store and on_change writes back to it."""
+    from streamlit_adjustable_columns import _commit_grid_value, adjustable_grid
+
+    stored = {"widths": [3, 1], "heights": [1, 2], "hidden": [False, False]}
+    store.put("alice", "adjustable_grid_grid", stored)
+    session_state = {}
+
+    with (
+        patch("streamlit_adjustable_columns._component_func") as mock_component,
+        patch(
+            "streamlit_adjustable_columns._component_supports_on_change",
+            return_value=True,
+        ),
+        patch("streamlit_adjustable_columns.st.session_state", session_state),
+        patch("streamlit_adjustable_columns.st.columns") as mock_columns,
+        patch("streamlit_adjustable_columns.st.markdown"),
+    ):
+        mock_columns.side_effect = [[MagicMock(), MagicMock()] for _ in range(2)]
+        mock_component.return_value = None
+
+        result = adjustable_grid(2, 2, return_widths=True, key="grid")
+        assert result["widths"] == [3, 1]
+        assert session_state["adjustable_grid_grid"] == stored
+
+        # A drag commits the new state from the on_change callback
+        session_state["resizer_grid"] = {"widths": [1, 1], "heights": [1, 1]}
+        _commit_grid_value("resizer_grid", "adjustable_grid_grid")
+
+    assert store.get("alice", "adjustable_grid_grid") == {
+        "widths": [1, 1],
+        "heights": [1, 1],
+        "hidden": [False, False],
+    }
+
+
+@pytest.mark.unit
+def test_stored_layout_takes_precedence_over_preset(store):
+    """Test that preset= doesn't overwrite a layout restored from the store."""
+    set_presets(
+        PresetRegistry(
+            {
+                "analyst": {"main": {"widths": [3, 1]}},
+                "ops": {"main": {"widths": [1, 1]}},
+            }
+        )
+    )
+    store.put("alice", "main", {"widths": [1, 5], "hidden": [False, False]})
+
+    try:
+        with (
+            patch("streamlit_adjustable_columns._component_func") as mock_component,
+            patch("streamlit_adjustable_columns.st.session_state", {}) as state,
+            patch("streamlit_adjustable_columns.st.columns") as mock_columns,
+            patch("streamlit_adjustable_columns.st.markdown"),
+            patch("streamlit_adjustable_columns.st.rerun"),
+        ):
+            mock_columns.return_value = [MagicMock(), MagicMock()]
+            mock_component.return_value = None
+
+            result = adjustable_columns(
+                2, preset="analyst", return_widths=True, key="main"
+            )
+            assert result["widths"] == [1, 5]
+            assert store.get("alice", "main")["widths"] == [1, 5]
+
+            # A preset chosen from the strip is still applied
+            state["adjustable_columns_active_preset"] = "ops"
+            result = adjustable_columns(
+                2, preset="analyst", return_widths=True, key="main"
+            )
+            assert result["widths"] == [1, 1]
+            assert store.get("alice", "main")["widths"] == [1, 1]
+    finally:
+        set_presets(None)
@@ -0,0 +1,168 @@
+"""Unit tests for named layout presets."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from streamlit_adjustable_columns import (
+    LayoutPreset,
+    PresetRegistry,
+    _commit_component_value,
+    adjustable_columns,
+    load_presets,
+    set_presets,
+)
+
+PRESETS = {
+    "analyst": {"main": {"widths": [3, 1]}, "side": {"widths": [1, 2]}},
+    "ops": {"main": {"widths": [1, 1], "hidden": [False, True]}},
+}
+
+
+@pytest.fixture
+def presets():
+    """The PRESETS registry installed for the duration of a test."""
+    registry = PresetRegistry(PRESETS)
+    set_presets(registry)
+    yield registry
+    set_presets(None)
+
+
+@pytest.mark.unit
+def test_registry_lookup():
+    """Test that presets are looked up by preset name and layout key."""
+    registry = PresetRegistry(PRESETS)
+    assert registry.names == ("analyst", "ops")
+    assert "ops" in registry
+    assert registry.get("analyst", "main") == LayoutPreset((3, 1), None)
+    assert registry.get("ops", "main") == LayoutPreset((1, 1), (False, True))
+    assert registry.get("ops", "side") is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "layout",
+    [
+        {"widths": []},
+        {"widths": [1, 0]},
+        {"widths": [1, 1], "hidden": [True]},
+        {"widths": [1, 1], "hidden": [0, 1]},
+    ],
+)
+def test_registry_validation(layout):
+    """Test that invalid preset layouts are rejected."""
+    with pytest.raises(ValueError):
+        PresetRegistry({"broken": {"main": layout}})
+
+
+@pytest.mark.unit
+def test_load_presets_parses_once(tmp_path):
+    """Test that JSON and TOML files load and are only parsed once."""
+    json_path = tmp_path / "presets.json"
+    json_path.write_text(json.dumps(PRESETS))
+    toml_path = tmp_path / "presets.toml"
+    toml_path.write_text(
+        "[analyst.main]\nwidths = [3, 1]\n\n"
+        "[ops.main]\nwidths = [1, 1]\nhidden = [false, true]\n"
+    )
+
+    from_json = load_presets(json_path)
+    assert load_presets(str(json_path)) is from_json
+    from_toml = load_presets(toml_path)
+    assert from_toml.get("ops", "main") == from_json.get("ops", "main")
+
+
+@pytest.mark.unit
+def test_preset_requires_registry():
+    """Test that using an unknown preset, or none at all, raises."""
+    with patch("streamlit_adjustable_columns.st.session_state", {}):
+        with pytest.raises(ValueError, match="set_presets"):
+            adjustable_columns(2, preset="analyst", key="main")
+
+        set_presets(PresetRegistry(PRESETS))
+        try:
+            with pytest.raises(ValueError, match="Unknown preset"):
+                adjustable_columns(2, preset="nope", key="main")
+        finally:
+            set_presets(None)
+
+
+@pytest.mark.unit
+def test_preset_applies_and_ignores_stale_values(presets):
+    """Test that presets apply once and outdated component values are dropped."""
+    with (
+        patch("streamlit_adjustable_columns._component_func") as mock_component,
+        patch("streamlit_adjustable_columns.st.session_state", {}) as state,
+        patch("streamlit_adjustable_columns.st.columns") as mock_columns,
+        patch("streamlit_adjustable_columns.st.markdown"),
+        patch("streamlit_adjustable_columns.st.rerun"),
+    ):
+        mock_columns.return_value = [MagicMock(), MagicMock()]
+        mock_component.return_value = None
+
+        result = adjustable_columns(2, preset="analyst", return_widths=True, key="main")
+        assert result["widths"] == [3, 1]
+        config = mock_component.call_args.kwargs["config"]
+        assert config["presets"] == ["analyst", "ops"]
+        assert config["preset"] == "analyst"
+        version = config["version"]
+
+        # A drag from the current version is kept across reruns
+        mock_component.return_value = {
+            "widths": [2, 2],
+            "hidden": [False, False],
+            "version": version,
+        }
+        result = adjustable_columns(2, preset="analyst", return_widths=True, key="main")
+        assert result["widths"] == [2, 2]
+
+        # Choosing "ops" from the strip applies it, and the drag value the
+        # component still holds no longer overrides the preset
+        state["main"] = {"action": "preset", "preset": "ops", "version": version}
+        _commit_component_value("main", "adjustable_columns_state_main")
+        result = adjustable_columns(2, preset="analyst", return_widths=True, key="main")
+        assert result["widths"] == [1, 1]
+        assert result["hidden"] == [False, True]
+        assert mock_component.call_args.kwargs["config"]["version"] == version + 1
+
+        # Layouts without an entry in the preset keep their state
+        result = adjustable_columns(
+            3, preset="analyst", return_widths=True, key="other"
+        )
+        assert result["widths"] == [1, 1, 1]
+
+
+@pytest.mark.unit
+def test_preset_action_without_on_change_support(presets):
+    """Test that presets chosen from the strip apply on the st.rerun() fallback."""
+    with (
+        patch("streamlit_adjustable_columns._component_func") as mock_component,
+        patch(
+            "streamlit_adjustable_columns._component_supports_on_change",
+            return_value=False,
+        ),
+        patch("streamlit_adjustable_columns.st.session_state", {}),
+        patch("streamlit_adjustable_columns.st.columns") as mock_columns,
+        patch("streamlit_adjustable_columns.st.markdown"),
+        patch("streamlit_adjustable_columns.st.rerun") as mock_rerun,
+    ):
+        mock_columns.return_value = [MagicMock(), MagicMock()]
+        mock_component.return_value = None
+
+        adjustable_columns(2, preset="analyst", key="main")
+        version = mock_component.call_args.kwargs["config"]["version"]
+
+        mock_component.return_value = {
+            "action": "preset",
+            "preset": "ops",
+            "version": version,
+        }
+        adjustable_columns(2, preset="analyst", key="main")
+        mock_rerun.assert_called_once()
+
+        # The rerun applies the preset, and the preset value is now outdated
+        result = adjustable_columns(2, preset="analyst", return_widths=True, key="main")
+        assert result["widths"] == [1, 1]
+        assert result["hidden"] == [False, True]
+        mock_rerun.assert_called_once()
@@ -0,0 +1,98 @@
+import os
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import Page, expect
+
+from tests import ROOT_DIRECTORY
+from tests.e2e_utils import StreamlitRunner
+
+BASIC_EXAMPLE_FILE = os.path.join(
+    ROOT_DIRECTORY, "tests", "streamlit_apps", "example_basic_columns.py"
+)
+
+IFRAME_SELECTOR = (
+    'iframe[title="streamlit_adjustable_columns.streamlit_adjustable_columns"]'
+)
+
+# Sends render messages to the component the same way Streamlit does on a
+# rerun, yielding to the event loop between batches so observers and timers
+# get to run
+RENDER_SCRIPT = """
+async (count) => {
+    for (let i = 0; i < count; i++) {
+        window.postMessage({
+            isStreamlitMessage: true,
+            type: "streamlit:render",
+            args: {
+                config: {
+                    widths: i % 2 ? [1, 2, 1] : [2, 1, 1],
+                    labels: ["A", "B", "C"],
+                    hidden: [false, i % 3 === 0, false],
+                    gap: "small",
+                    border: false,
+                    version: 0
+                }
+            },
+            theme: {
+                base: "light",
+                primaryColor: "#ff4b4b",
+                backgroundColor: "#ffffff",
+                secondaryBackgroundColor: "#f0f2f6",
+                textColor: "#31333f",
+                font: "sans-serif"
+            }
+        }, "*")
+        if (i % 50 === 49) await new Promise(resolve => setTimeout(resolve, 0))
+    }
+    await new Promise(resolve => requestAnimationFrame(() => setTimeout(resolve, 0)))
+}
+"""
+
+
+@pytest.fixture(autouse=True, scope="module")
+def streamlit_app():
+    with StreamlitRunner(Path(BASIC_EXAMPLE_FILE)) as runner:
+        yield runner
+
+
+@pytest.fixture(autouse=True, scope="function")
+def go_to_app(page: Page, streamlit_app: StreamlitRunner):
+    page.goto(streamlit_app.server_url)
+    # Wait for app to load
+    page.get_by_role("img", name="Running...").is_hidden()
+
+
+def _component_frame(page: Page):
+    iframe = page.locator(IFRAME_SELECTOR).first
+    expect(iframe).to_be_visible()
+    frame = iframe.element_handle().content_frame()
+    expect(frame.locator(".resize-handle").first).to_be_attached()
+    return frame
+
+
+def _heap_after_gc(cdp):
+    cdp.send("HeapProfiler.collectGarbage")
+    cdp.send("HeapProfiler.collectGarbage")
+    return cdp.send("Runtime.getHeapUsage")["usedSize"]
+
+
+@pytest.mark.e2e
+@pytest.mark.slow
+@pytest.mark.only_browser("chromium")
+def test_reruns_do_not_leak(page: Page):
+    """Test that 1000 reruns leave one strip, one style element and flat memory."""
+    frame = _component_frame(page)
+    cdp = page.context.new_cdp_session(page)
+
+    # Warm up so that lazily allocated caches don't count as growth
+    frame.evaluate(RENDER_SCRIPT, 100)
+    baseline = _heap_after_gc(cdp)
+
+    frame.evaluate(RENDER_SCRIPT, 1000)
+    growth = _heap_after_gc(cdp) - baseline
+
+    assert frame.locator(".resize-handle-container").count() == 1
+    assert frame.locator(".resize-handle").count() == 2
+    assert frame.locator("#adjustable-columns-styles").count() == 1
+    assert growth < 1024 * 1024, f"JS heap grew by {growth} bytes over 1000 reruns"
@@ -26,7 +26,8 @@ def test_adjustable_columns_basic():
         # Test basic usage
         cols = adjustable_columns(2)
         assert len(cols) == 2
-        assert all(isinstance(col, HidableContainer) for col in cols)
+        # Nothing is hidden, so the st.columns containers are returned as-is
+        assert not any(isinstance(col, HidableContainer) for col in cols)
 
         # Test with return_widths
         result = adjustable_columns(2, return_widths=True)
@@ -83,10 +84,10 @@ def test_adjustable_columns_hidden(monkeypatch):
     )
     assert "hidden" in result
     assert result["hidden"] == [False, False, False]
-    assert all(isinstance(c, HidableContainer) for c in result["columns"])
+    assert not any(isinstance(c, HidableContainer) for c in result["columns"])
 
     # Simulate hiding the second column
-    state["adjustable_columns_hidden_test_hidden"] = [False, True, False]
+    state["adjustable_columns_state_test_hidden"].update(hidden=[False, True, False])
     result2 = adjustable_columns(
         [1, 1, 1], labels=["A", "B", "C"], return_widths=True, key="test_hidden"
     )
@@ -119,11 +120,9 @@ def test_adjustable_columns_initial_hidden(monkeypatch):
     assert not result["columns"][2].is_hidden
 
     # Test that session state was initialized correctly
-    assert state["adjustable_columns_hidden_test_initial_hidden"] == [
-        False,
-        True,
-        False,
-    ]
+    layout_state = state["adjustable_columns_state_test_initial_hidden"]
+    assert layout_state.hidden == [False, True, False]
+    assert layout_state.hidden_mask == 0b010
 
 
 @pytest.mark.unit
@@ -200,13 +199,8 @@ def test_adjustable_columns_basic_usage():
         # Call the function
         result = adjustable_columns(3)
 
-        # Check that it returns the columns (now wrapped in HidableContainer)
-        assert len(result) == 3
-        assert all(isinstance(col, HidableContainer) for col in result)
-        # Check that the containers wrap the original mock columns
-        assert result[0].container == mock_col1
-        assert result[1].container == mock_col2
-        assert result[2].container == mock_col3
+        # Check that it returns the columns (unwrapped, since none is hidden)
+        assert result == [mock_col1, mock_col2, mock_col3]
 
 
 @pytest.mark.unit
@@ -219,6 +213,10 @@ def test_adjustable_columns_with_ratios():
         result = adjustable_columns([3, 1])
 
         assert len(result) == 2
+        assert result == [mock_col1, mock_col2]
+
+        # With a hidden column, every column is wrapped in HidableContainer
+        result = adjustable_columns([3, 1], initial_hidden=[False, True], key="wrap")
         assert all(isinstance(col, HidableContainer) for col in result)
         # Check that the containers wrap the original mock columns
         assert result[0].container == mock_col1
@@ -386,3 +384,738 @@ def test_component_integration():
             assert "widths" in config
             assert "labels" in config
             assert config["labels"] == ["A", "B", "C"]
+
+
+@pytest.mark.unit
+def test_commit_component_value_updates_session_state(monkeypatch):
+    """Test that the on_change commit path writes widths before the rerun."""
+    from streamlit_adjustable_columns import _commit_component_value
+    from streamlit_adjustable_columns.state import LayoutState
+
+    state = {
+        "resizer_commit": {"widths": [2.0, 1.0], "hidden": [False, True]},
+        "adjustable_columns_state_commit": LayoutState([1, 1], [False, False]),
+    }
+    monkeypatch.setattr(st, "session_state", state)
+    user_callback = MagicMock()
+
+    _commit_component_value(
+        "resizer_commit", "adjustable_columns_state_commit", user_callback
+    )
+
+    assert state["adjustable_columns_state_commit"].widths == (2.0, 1.0)
+    assert state["adjustable_columns_state_commit"].hidden == [False, True]
+    user_callback.assert_called_once_with()
+
+
+@pytest.mark.unit
+def test_on_change_commit_avoids_rerun():
+    """Test that a committed component value does not trigger st.rerun()."""
+    session_state = {}
+    user_callback = MagicMock()
+
+    with (
+        patch("streamlit_adjustable_columns._component_func") as mock_component,
+        patch("streamlit_adjustable_columns._COMPONENT_SUPPORTS_ON_CHANGE", True),
+        patch("streamlit_adjustable_columns.st.session_state", session_state),
+        patch("streamlit_adjustable_columns.st.columns") as mock_columns,
+        patch("streamlit_adjustable_columns.st.markdown"),
+        patch("streamlit_adjustable_columns.st.rerun") as mock_rerun,
+    ):
+        mock_columns.return_value = [MagicMock(), MagicMock()]
+        mock_component.return_value = None
+
+        adjustable_columns(2, key="commit", on_change=user_callback)
+
+        on_change = mock_component.call_args[1]["on_change"]
+
+        # Simulate Streamlit running the callback before the next script run
+        session_state["resizer_commit"] = {
+            "widths": [1.5, 0.5],
+            "hidden": [False, False],
+        }
+        on_change()
+        user_callback.assert_called_once_with()
+
+        mock_component.return_value = session_state["resizer_commit"]
+        result = adjustable_columns(2, key="commit", return_widths=True)
+
+        assert result["widths"] == [1.5, 0.5]
+        assert mock_component.call_args[1]["config"]["widths"] == [1.5, 0.5]
+        mock_rerun.assert_not_called()
+
+
+@pytest.mark.unit
+def test_call_site_id_is_cached_and_disambiguated(monkeypatch):
+    """Test that auto keys are stable per call site and unique within a run."""
+    import sys
+
+    import streamlit_adjustable_columns
+    from streamlit_adjustable_columns import _call_site_id
+
+    class FakeContext:
+        def __init__(self):
+            self.cursors = {}
+
+    ctx = FakeContext()
+    monkeypatch.setattr(streamlit_adjustable_columns, "get_script_run_ctx", lambda: ctx)
+
+    def ids_for_one_run():
+        return [_call_site_id(sys._getframe()) for _ in range(3)]
+
+    first_run = ids_for_one_run()
+    base_id = first_run[0]
+    assert first_run == [base_id, f"{base_id}_1", f"{base_id}_2"]
+
+    # A new run (Streamlit resets ctx.cursors) starts counting again
+    ctx.cursors = {}
+    assert ids_for_one_run() == first_run
+
+
+@pytest.mark.unit
+def test_alignment_css_emitted_once_per_run(monkeypatch):
+    """Test that the alignment CSS is only sent with the first layout of a run."""
+    import streamlit_adjustable_columns
+
+    class FakeContext:
+        def __init__(self):
+            self.cursors = {}
+
+    ctx = FakeContext()
+    monkeypatch.setattr(streamlit_adjustable_columns, "get_script_run_ctx", lambda: ctx)
+
+    with (
+        patch("streamlit_adjustable_columns._component_func") as mock_component,
+        patch("streamlit_adjustable_columns.st.session_state", {}),
+        patch("streamlit_adjustable_columns.st.columns") as mock_columns,
+        patch("streamlit_adjustable_columns.st.markdown") as mock_markdown,
+    ):
+        mock_component.return_value = None
+        mock_columns.return_value = [MagicMock(), MagicMock()]
+
+        adjustable_columns(2, key="css_a")
+        adjustable_columns(2, key="css_b")
+        assert mock_markdown.call_count == 1
+
+        # The next script run needs the styles again
+        ctx.cursors = {}
+        adjustable_columns(2, key="css_a")
+        assert mock_markdown.call_count == 2
+
+
+@pytest.mark.unit
+def test_adjustable_layouts_single_component():
+    """Test that adjustable_layouts drives several column sets with one component."""
+    from streamlit_adjustable_columns import LayoutSlot, adjustable_layouts
+
+    session_state = {}
+
+    with (
+        patch("streamlit_adjustable_columns._component_func") as mock_component,
+        patch("streamlit_adjustable_columns.st.session_state", session_state),
+        patch("streamlit_adjustable_columns.st.columns") as mock_columns,
+        patch("streamlit_adjustable_columns.st.markdown"),
+        patch("streamlit_adjustable_columns.st.rerun"),
+    ):
+        mock_component.return_value = {
+            "layouts": [
+                {"widths": [1, 1, 1], "hidden": [False, False, False]},
+                {"widths": [1.5, 1.5], "hidden": [False, True]},
+            ]
+        }
+
+        top, bottom = adjustable_layouts(
+            [
+                {"spec": 3, "labels": ["A", "B", "C"]},
+                {"spec": [2, 1], "key": "bottom", "return_widths": True},
+            ],
+            key="batch",
+        )
+
+        mock_component.assert_called_once()
+        config = mock_component.call_args[1]["config"]
+        assert [layout["labels"] for layout in config["layouts"]] == [
+            ["A", "B", "C"],
+            ["Col 1", "Col 2"],
+        ]
+
+        assert isinstance(top, LayoutSlot)
+        assert session_state["adjustable_columns_state_batch_bottom"].widths == (
+            1.5,
+            1.5,
+        )
+        assert bottom.hidden == [False, True]
+
+        # Columns are only created when requested
+        mock_columns.assert_not_called()
+        mock_columns.return_value = [MagicMock(), MagicMock()]
+        result = bottom.columns()
+        assert result["widths"] == [1.5, 1.5]
+        assert result["columns"][1].is_hidden
+
+
+@pytest.mark.unit
+def test_adjustable_layouts_validation():
+    """Test validation of the layouts passed to adjustable_layouts."""
+    from streamlit_adjustable_columns import adjustable_layouts
+
+    with pytest.raises(ValueError, match="at least one layout"):
+        adjustable_layouts([])
+
+    with pytest.raises(ValueError, match="Unknown layout option"):
+        adjustable_layouts([{"spec": 2, "widths": [1, 1]}])
+
+
+@pytest.mark.unit
+def test_adjustable_grid_single_state_object():
+    """Test that adjustable_grid keeps widths and heights in one state object."""
+    from streamlit_adjustable_columns import adjustable_grid
+
+    session_state = {}
+
+    with (
+        patch("streamlit_adjustable_columns._component_func") as mock_component,
+        patch("streamlit_adjustable_columns.st.session_state", session_state),
+        patch("streamlit_adjustable_columns.st.columns") as mock_columns,
+        patch("streamlit_adjustable_columns.st.markdown"),
+        patch("streamlit_adjustable_columns.st.rerun"),
+    ):
+        mock_component.return_value = {
+            "widths": [1.5, 0.5],
+            "heights": [3, 1],
+            "hidden": [False, True],
+        }
+        row_columns = [[MagicMock(), MagicMock()], [MagicMock(), MagicMock()]]
+        mock_columns.side_effect = row_columns
+
+        result = adjustable_grid(2, 2, height=400, return_widths=True, key="grid")
+
+        # One component instance for the whole grid
+        mock_component.assert_called_once()
+        assert "grid" in mock_component.call_args[1]["config"]
+
+        assert session_state["adjustable_grid_grid"] == {
+            "widths": [1.5, 0.5],
+            "heights": [3, 1],
+            "hidden": [False, True],
+        }
+        assert result["heights"] == [3, 1]
+
+        cells = result["cells"]
+        assert len(cells) == 2 and all(len(row) == 2 for row in cells)
+        assert cells[0][1].is_hidden and not cells[1][0].is_hidden
+
+        # Row heights are shared out of the total grid height
+        assert row_columns[0][0].container.call_args[1]["height"] == 300
+        assert row_columns[1][0].container.call_args[1]["height"] == 100
+
+
+@pytest.mark.unit
+def test_adjustable_grid_ignores_mismatched_values():
+    """Test that grid values sent for another number of columns or rows are ignored."""
+    from streamlit_adjustable_columns import _commit_grid_value, adjustable_grid
+
+    session_state = {}
+
+    with (
+        patch("streamlit_adjustable_columns._component_func") as mock_component,
+        patch("streamlit_adjustable_columns.st.session_state", session_state),
+        patch("streamlit_adjustable_columns.st.columns") as mock_columns,
+        patch("streamlit_adjustable_columns.st.markdown"),
+        patch("streamlit_adjustable_columns.st.rerun") as mock_rerun,
+    ):
+        mock_columns.side_effect = [[MagicMock(), MagicMock()] for _ in range(2)]
+        mock_component.return_value = {"widths": [1, 1, 1], "heights": [2, 1]}
+
+        result = adjustable_grid(2, 2, return_widths=True, key="grid")
+        assert result["widths"] == [1, 1] and result["heights"] == [1, 1]
+        mock_rerun.assert_not_called()
+
+        session_state["resizer_grid"] = {"widths": [2, 1], "heights": [1, 1, 1]}
+        _commit_grid_value("resizer_grid", "adjustable_grid_grid")
+        assert session_state["adjustable_grid_grid"]["heights"] == [1, 1]
+
+
+@pytest.mark.unit
+def test_adjustable_grid_validation():
+    """Test validation of adjustable_grid parameters."""
+    from streamlit_adjustable_columns import adjustable_grid
+
+    with pytest.raises(ValueError, match="row_labels must have the same length"):
+        adjustable_grid(2, 2, row_labels=["Only one"])
+
+
+@pytest.mark.unit
+def test_render_columns_skips_hidden_columns():
+    """Test that renderers of hidden columns are never called."""
+    from streamlit_adjustable_columns import render_columns
+
+    columns = [
+        HidableContainer(MagicMock(), is_hidden=False),
+        HidableContainer(MagicMock(), is_hidden=True),
+        HidableContainer(MagicMock(), is_hidden=False),
+    ]
+    visible = MagicMock(return_value="visible")
+    expensive = MagicMock()
+
+    results = render_columns({"columns": columns}, [visible, expensive, None])
+
+    assert results == ["visible", None, None]
+    visible.assert_called_once_with()
+    expensive.assert_not_called()
+    columns[0].container.__enter__.assert_called_once()
+
+    with pytest.raises(ValueError, match="renderers must have the same length"):
+        render_columns(columns, [visible])
+
+
+@pytest.mark.unit
+def test_hidable_container_is_lazy():
+    """Test that HidableContainer only creates a placeholder when needed."""
+    container = MagicMock()
+
+    visible = HidableContainer(container, is_hidden=False)
+    assert visible.write is visible.write  # Wrapper is cached
+    visible.write("hello")
+    container.write.assert_called_once_with("hello")
+    container.empty.assert_not_called()
+
+    hidden = HidableContainer(container, is_hidden=True)
+    hidden.metric("Sales", 1)
+    container.metric.assert_not_called()
+    container.empty.assert_not_called()
+
+    with hidden:
+        pass
+    container.empty.assert_called_once()
+
+
+@pytest.mark.unit
+def test_hidden_container_methods_return_context_managers():
+    """Test that ``with hidden_col.expander(...)`` discards its output."""
+    container = MagicMock()
+    hidden = HidableContainer(container, is_hidden=True)
+
+    with hidden.expander("Details") as inner:
+        assert inner is container.empty.return_value.__enter__.return_value
+    container.expander.assert_not_called()
+    # The placeholder is cleared when the block exits
+    container.empty.return_value.empty.assert_called_once()
+
+
+@pytest.mark.unit
+def test_return_widths_includes_pixel_geometry():
+    """Test that pixel sizes reported by the frontend are returned."""
+    session_state = {}
+    user_callback = MagicMock()
+
+    with (
+        patch("streamlit_adjustable_columns._component_func") as mock_component,
+        patch("streamlit_adjustable_columns.st.session_state", session_state),
+        patch("streamlit_adjustable_columns.st.columns") as mock_columns,
+        patch("streamlit_adjustable_columns.st.markdown"),
+        patch("streamlit_adjustable_columns.st.rerun"),
+    ):
+        mock_columns.return_value = [MagicMock(), MagicMock()]
+        mock_component.return_value = None
+
+        # Pixel sizes are only reported on request
+        adjustable_columns(2, return_widths=True, key="ratios")
+        assert "reportPixels" not in mock_component.call_args[1]["config"]
+
+        result = adjustable_columns(
+            2,
+            return_widths=True,
+            report_pixels=True,
+            key="pixels",
+            on_change=user_callback,
+        )
+        assert result["pixel_widths"] is None
+        config = mock_component.call_args[1]["config"]
+        assert config["reportPixels"] is True
+        assert config["containerWidth"] is None
+
+        # The frontend reports its measured geometry
+        session_state["resizer_pixels"] = {
+            "widths": [1, 1],
+            "hidden": [False, False],
+            "action": "measure",
+            "containerWidth": 808,
+            "pixelWidths": [400, 400],
+            "devicePixelRatio": 2,
+        }
+        mock_component.call_args[1]["on_change"]()
+        user_callback.assert_not_called()
+
+        mock_component.return_value = session_state["resizer_pixels"]
+        result = adjustable_columns(
+            2, return_widths=True, report_pixels=True, key="pixels"
+        )
+        assert result["pixel_widths"] == [400, 400]
+        assert result["container_width"] == 808
+        assert result["device_pixel_ratio"] == 2
+        assert mock_component.call_args[1]["config"]["containerWidth"] == 808
+
+
+@pytest.mark.unit
+def test_live_mode_config():
+    """Test that live mode is passed to the frontend with its interval in ms."""
+    with (
+        patch("streamlit_adjustable_columns._component_func") as mock_component,
+        patch("streamlit_adjustable_columns.st.session_state", {}),
+        patch("streamlit_adjustable_columns.st.columns") as mock_columns,
+        patch("streamlit_adjustable_columns.st.markdown"),
+    ):
+        mock_component.return_value = None
+        mock_columns.return_value = [MagicMock(), MagicMock()]
+
+        adjustable_columns(2, key="static")
+        assert "live" not in mock_component.call_args[1]["config"]
+
+        adjustable_columns(2, key="live", live=True, live_interval=0.5)
+        config = mock_component.call_args[1]["config"]
+        assert config["live"] is True
+        assert config["liveInterval"] == 500
+
+        with pytest.raises(ValueError, match="live_interval must be a positive"):
+            adjustable_columns(2, key="live", live=True, live_interval=0)
+
+
+@pytest.mark.unit
+def test_config_fingerprint():
+    """Test that the config fingerprint only changes when the config does."""
+    with (
+        patch("streamlit_adjustable_columns._component_func") as mock_component,
+        patch("streamlit_adjustable_columns.st.session_state", {}),
+        patch("streamlit_adjustable_columns.st.columns") as mock_columns,
+        patch("streamlit_adjustable_columns.st.markdown"),
+    ):
+        mock_columns.return_value = [MagicMock(), MagicMock()]
+        mock_component.return_value = None
+
+        adjustable_columns(2, key="fingerprint")
+        first = mock_component.call_args[1]["config"]["fingerprint"]
+        adjustable_columns(2, key="fingerprint")
+        assert mock_component.call_args[1]["config"]["fingerprint"] == first
+
+        mock_component.return_value = {"widths": [2, 1], "hidden": [False, False]}
+        adjustable_columns(2, key="fingerprint")
+        adjustable_columns(2, key="fingerprint")
+        assert mock_component.call_args[1]["config"]["fingerprint"] != first
+
+
+@pytest.mark.unit
+def test_idle_layout_state_is_evicted(monkeypatch):
+    """Test that state of layouts not rendered for max_idle_runs runs is removed."""
+    import streamlit_adjustable_columns
+
+    class FakeContext:
+        def __init__(self):
+            self.cursors = {}
+
+    ctx = FakeContext()
+    monkeypatch.setattr(streamlit_adjustable_columns, "get_script_run_ctx", lambda: ctx)
+    streamlit_adjustable_columns.set_state_retention(2)
+
+    try:
+        with (
+            patch("streamlit_adjustable_columns._component_func") as mock_component,
+            patch("streamlit_adjustable_columns.st.session_state", {}) as state,
+            patch("streamlit_adjustable_columns.st.columns") as mock_columns,
+            patch("streamlit_adjustable_columns.st.markdown"),
+        ):
+            mock_component.return_value = None
+            mock_columns.return_value = [MagicMock(), MagicMock()]
+
+            adjustable_columns(2, key="kept")
+            adjustable_columns(2, key="dropped")
+            assert "adjustable_columns_state_dropped" in state
+
+            # Two more runs without "dropped" keep its state...
+            for _ in range(2):
+                ctx.cursors = {}
+                adjustable_columns(2, key="kept")
+            assert "adjustable_columns_state_dropped" in state
+
+            # ...and the third one evicts it
+            ctx.cursors = {}
+            adjustable_columns(2, key="kept")
+            assert "adjustable_columns_state_dropped" not in state
+            assert "adjustable_columns_state_kept" in state
+
+        with pytest.raises(ValueError, match="max_idle_runs"):
+            streamlit_adjustable_columns.set_state_retention(0)
+    finally:
+        streamlit_adjustable_columns.set_state_retention(None)
+
+
+@pytest.mark.unit
+def test_fragment_reruns_do_not_evict_layouts(monkeypatch):
+    """Test that fragment reruns don't count as runs for state retention."""
+    import streamlit_adjustable_columns
+
+    class FakeContext:
+        def __init__(self):
+            self.cursors = {}
+            self.fragment_ids_this_run = None
+
+    ctx = FakeContext()
+    monkeypatch.setattr(streamlit_adjustable_columns, "get_script_run_ctx", lambda: ctx)
+    streamlit_adjustable_columns.set_state_retention(1)
+
+    try:
+        with (
+            patch("streamlit_adjustable_columns._component_func") as mock_component,
+            patch("streamlit_adjustable_columns.st.session_state", {}) as state,
+            patch("streamlit_adjustable_columns.st.columns") as mock_columns,
+            patch("streamlit_adjustable_columns.st.markdown"),
+        ):
+            mock_component.return_value = None
+            mock_columns.return_value = [MagicMock(), MagicMock()]
+
+            adjustable_columns(2, key="outside")
+            adjustable_columns(2, key="fragment")
+
+            # Fragment reruns only render the layout inside the fragment
+            ctx.fragment_ids_this_run = ["fragment_id"]
+            for _ in range(3):
+                ctx.cursors = {}
+                adjustable_columns(2, key="fragment")
+            assert "adjustable_columns_state_outside" in state
+            assert "adjustable_columns_state_fragment" in state
+    finally:
+        streamlit_adjustable_columns.set_state_retention(None)
+
+
+@pytest.mark.unit
+def test_fragment_reruns_keep_call_site_ids(monkeypatch):
+    """Test that layouts in a fragment keep their auto-generated ids on reruns."""
+    import sys
+
+    import streamlit_adjustable_columns
+    from streamlit_adjustable_columns import _call_site_id
+
+    class FakeContext:
+        def __init__(self):
+            self.cursors = {}
+            self.fragment_ids_this_run = None
+            self.current_fragment_id = None
+
+    ctx = FakeContext()
+    monkeypatch.setattr(streamlit_adjustable_columns, "get_script_run_ctx", lambda: ctx)
+
+    def layout_id():
+        return _call_site_id(sys._getframe())
+
+    def fragment():
+        ctx.current_fragment_id = "fragment_id"
+        try:
+            return layout_id()
+        finally:
+            ctx.current_fragment_id = None
+
+    # The same call site is used outside of and inside the fragment
+    outside_id = layout_id()
+    fragment_id = fragment()
+    assert fragment_id == f"{outside_id}_1"
+
+    for _ in range(2):
+        ctx.cursors = {}
+        ctx.fragment_ids_this_run = ["fragment_id"]
+        assert fragment() == fragment_id
+
+    # The next full run assigns the same ids again
+    ctx.cursors = {}
+    ctx.fragment_ids_this_run = None
+    assert layout_id() == outside_id
+    assert fragment() == fragment_id
+
+
+@pytest.mark.unit
+def test_layout_state_is_compact():
+    """Test that layout state rounds widths, packs hidden flags and shares labels."""
+    from streamlit_adjustable_columns.state import LayoutState
+
+    first = LayoutState([1.123456, 2], [False, True], ["A", "B"])
+    second = LayoutState([1, 1], [False, False], ["A", "B"])
+
+    assert first.widths == (1.1235, 2)
+    assert first.hidden_mask == 0b10
+    assert first.hidden == [False, True]
+    assert first.labels is second.labels
+    assert not hasattr(first, "__dict__")
+
+    assert first.update(widths=[1.12354, 2.0]) is False
+    assert first.update(hidden=[True, True]) is True
+    assert first.to_dict() == {"widths": [1.1235, 2], "hidden": [True, True]}
+
+
+@pytest.mark.unit
+def test_column_layout_render():
+    """Test that a ColumnLayout is built once and rendered like adjustable_columns."""
+    from streamlit_adjustable_columns import ColumnLayout
+
+    layout = ColumnLayout([2, 1], labels=["Main", "Side"], key="compiled")
+    static_config = dict(layout._config)
+
+    with (
+        patch("streamlit_adjustable_columns._component_func") as mock_component,
+        patch("streamlit_adjustable_columns.st.session_state", {}),
+        patch("streamlit_adjustable_columns.st.columns") as mock_columns,
+        patch("streamlit_adjustable_columns.st.markdown"),
+    ):
+        mock_columns.return_value = [MagicMock(), MagicMock()]
+        mock_component.return_value = {"widths": [1, 1], "hidden": [False, True]}
+
+        layout.render()
+        columns = layout.render()
+
+        config = mock_component.call_args[1]["config"]
+        assert config["labels"] == ["Main", "Side"]
+        assert config["widths"] == [1, 1]
+        assert columns[1].is_hidden
+
+    # Rendering never changes the shared instance
+    assert layout._config == static_config
+    assert not hasattr(layout, "__dict__")
+
+    with pytest.raises(ValueError, match="labels must have the same length"):
+        ColumnLayout(2, labels=["Only one"])
+
+
+@pytest.mark.unit
+def test_columns_kwargs_follow_installed_streamlit():
+    """Test that st.columns only gets the arguments it supports."""
+    from streamlit_adjustable_columns import _columns_kwargs
+
+    with patch(
+        "streamlit_adjustable_columns._COLUMNS_PARAMS", frozenset({"spec", "gap"})
+    ):
+        assert _columns_kwargs("small", "center", True) == {"gap": "small"}
+
+    assert _columns_kwargs("large", "bottom", True) == {
+        "gap": "large",
+        "vertical_alignment": "bottom",
+        "border": True,
+    }
+
+
+@pytest.mark.unit
+def test_component_is_declared_on_first_use():
+    """Test that importing the package doesn't declare the component."""
+    import subprocess
+    import sys
+
+    import streamlit_adjustable_columns
+
+    script = (
+        "import streamlit_adjustable_columns as m\n"
+        "print(m._declare_component.cache_info().currsize)\n"
+        "m.warmup()\n"
+        "print(m._declare_component.cache_info().currsize)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    assert output.split() == ["0", "1"]
+
+    with patch("streamlit_adjustable_columns._declare_component") as declare:
+        streamlit_adjustable_columns._component_func(config={}, key="lazy")
+        declare.return_value.assert_called_once_with(config={}, key="lazy")
+
+
+@pytest.mark.unit
+def test_build_is_checked_against_manifest(tmp_path):
+    """Test that the frontend build is checked against its asset manifest."""
+    import json
+
+    from streamlit_adjustable_columns import _check_build
+
+    with pytest.raises(RuntimeError, match="Compiled frontend assets not found"):
+        _check_build(str(tmp_path))
+
+    files = {"index.html": "index.html", "main.js": "main.0123abcd.js"}
+    (tmp_path / "asset-manifest.json").write_text(json.dumps({"files": files}))
+    (tmp_path / "index.html").write_text("<html></html>")
+    with pytest.raises(RuntimeError, match="Compiled frontend assets not found"):
+        _check_build(str(tmp_path))
+
+    (tmp_path / "main.0123abcd.js").write_text("")
+    _check_build(str(tmp_path))
+
+    # Inline builds are a single index.html
+    inline = {"files": {"index.html": "index.html"}}
+    (tmp_path / "asset-manifest.json").write_text(json.dumps(inline))
+    (tmp_path / "main.0123abcd.js").unlink()
+    _check_build(str(tmp_path))
+
+
+@pytest.mark.unit
+def test_compact_encoding_roundtrip():
+    """Test that widths and hidden flags survive the compact encoding."""
+    from streamlit_adjustable_columns.state import (
+        decode_hidden,
+        decode_widths,
+        encode_hidden,
+        encode_widths,
+        pack_hidden,
+        pack_widths,
+    )
+
+    widths = pack_widths([1 + i / 7 for i in range(300)])
+    assert pack_widths(decode_widths(encode_widths(widths))) == widths
+
+    hidden = [i % 3 == 0 for i in range(300)]
+    mask = pack_hidden(hidden)
+    assert decode_hidden(encode_hidden(mask, len(hidden))) == mask
+    assert len(encode_widths(widths)) < len(str(list(widths)))
+
+
+@pytest.mark.unit
+def test_wide_layout_uses_compact_config():
+    """Test that layouts with many columns send and accept compact widths."""
+    from streamlit_adjustable_columns.state import (
+        decode_widths,
+        encode_hidden,
+        encode_widths,
+    )
+
+    count = 200
+    with (
+        patch("streamlit_adjustable_columns._component_func") as mock_component,
+        patch("streamlit_adjustable_columns.st.session_state", {}) as state,
+        patch("streamlit_adjustable_columns.st.columns") as mock_columns,
+        patch("streamlit_adjustable_columns.st.markdown"),
+        patch("streamlit_adjustable_columns.st.rerun"),
+    ):
+        mock_columns.return_value = [MagicMock() for _ in range(count)]
+        mock_component.return_value = None
+
+        adjustable_columns(count, key="wide")
+        config = mock_component.call_args[1]["config"]
+        assert config["virtual"] is True
+        assert decode_widths(config["widths"]) == (1.0,) * count
+
+        # The strip answers in the same encoding
+        widths = [2.0] + [1.0] * (count - 1)
+        mock_component.return_value = {
+            "widths": encode_widths(widths),
+            "hidden": encode_hidden(0b10, count),
+            "version": config["version"],
+        }
+        result = adjustable_columns(count, return_widths=True, key="wide")
+        assert result["widths"] == widths
+        assert result["hidden"][:3] == [False, True, False]
+        assert state["adjustable_columns_state_wide"].hidden_mask == 0b10
+
+        # A narrow column keeps its width instead of being raised to 6%
+        spec = mock_columns.call_args[1]["spec"]
+        assert spec[1] == 1.0
+
+        # Values with the wrong number of columns are ignored
+        mock_component.return_value = {"widths": encode_widths([1.0, 1.0])}
+        result = adjustable_columns(count, return_widths=True, key="wide")
+        assert result["widths"] == widths
+
+        adjustable_columns(3, key="narrow")
+        assert "virtual" not in mock_component.call_args[1]["config"]
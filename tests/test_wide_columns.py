@@ -0,0 +1,92 @@
+# flake8: noqa: E501
+
+import os
+import re
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import Page, expect
+
+from tests import ROOT_DIRECTORY
+from tests.e2e_utils import StreamlitRunner
+
+WIDE_EXAMPLE_FILE = os.path.join(
+    ROOT_DIRECTORY, "tests", "streamlit_apps", "example_wide_columns.py"
+)
+
+IFRAME_SELECTOR = (
+    'iframe[title="streamlit_adjustable_columns.streamlit_adjustable_columns"]'
+)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def streamlit_app():
+    with StreamlitRunner(Path(WIDE_EXAMPLE_FILE)) as runner:
+        yield runner
+
+
+@pytest.fixture(autouse=True, scope="function")
+def go_to_app(page: Page, streamlit_app: StreamlitRunner):
+    page.goto(streamlit_app.server_url)
+    # Wait for app to load
+    page.get_by_role("img", name="Running...").is_hidden()
+
+
+@pytest.mark.e2e
+def test_wide_strip_is_virtualized(page: Page):
+    """Test that only the handles in view are rendered, and scrolling shows more."""
+    frame = page.frame_locator(IFRAME_SELECTOR).first
+    expect(frame.locator(".resize-handle").first).to_be_visible()
+
+    # 200 columns, but only the ones in view (plus overscan) have nodes
+    visible = frame.locator(".column-indicator:visible")
+    assert 0 < visible.count() < 50
+    expect(frame.locator(".column-indicator[data-index='199']")).to_have_count(0)
+
+    # Scrolling to the end renders the last columns
+    frame.locator(".resize-handle-container").evaluate(
+        "node => node.scrollLeft = node.scrollWidth"
+    )
+    expect(frame.locator(".column-indicator[data-index='199']")).to_be_visible()
+    assert frame.locator(".column-indicator:visible").count() < 50
+
+
+@pytest.mark.e2e
+def test_wide_strip_resize(page: Page):
+    """Test that dragging a handle of a virtualized strip updates the widths."""
+    frame = page.frame_locator(IFRAME_SELECTOR).first
+    handle = frame.locator(".resize-handle[data-index='0']")
+    expect(handle).to_be_visible()
+
+    box = handle.bounding_box()
+    page.mouse.move(box["x"] + box["width"] / 2, box["y"] + box["height"] / 2)
+    page.mouse.down()
+    page.mouse.move(box["x"] + 60, box["y"] + box["height"] / 2, steps=5)
+    page.mouse.up()
+
+    # The first column grew at the expense of the second
+    expect(page.get_by_text(re.compile(r"First widths: \[1\.[1-9]"))).to_be_visible()
+
+
+@pytest.mark.e2e
+def test_wide_strip_drag_survives_scrolling(page: Page):
+    """Test that a drag continues when its handle scrolls out of the rendered window."""
+    frame = page.frame_locator(IFRAME_SELECTOR).first
+    handle = frame.locator(".resize-handle[data-index='0']")
+    expect(handle).to_be_visible()
+
+    box = handle.bounding_box()
+    y = box["y"] + box["height"] / 2
+    page.mouse.move(box["x"] + box["width"] / 2, y)
+    page.mouse.down()
+    page.mouse.move(box["x"] + 20, y, steps=2)
+
+    # Scroll the dragged handle far out of view, then keep dragging
+    frame.locator(".resize-handle-container").evaluate(
+        "node => node.scrollLeft = node.scrollWidth"
+    )
+    page.mouse.move(box["x"] + 100, y, steps=5)
+    page.mouse.up()
+
+    # The whole drag was applied: the second column is at its minimum width
+    expect(page.get_by_text(re.compile(r"First widths: \[1\.5, 0\.5"))).to_be_visible()
@@ -108,3 +108,9 @@ def test_width_tracking_resize_handles(page: Page):
 
     handle_count = resize_handles.count()
     assert handle_count == 2
+
+
+@pytest.mark.e2e
+def test_should_report_pixel_widths(page: Page):
+    """Test that the rendered pixel widths are reported back to Python."""
+    expect(page.locator("text=/Pixel widths: \\[\\d/")).to_be_visible()